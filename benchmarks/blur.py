@@ -0,0 +1,102 @@
+"""
+Compares the time taken by each Blur method to blur an area of a scene. Runs headless, using
+the SDL 'dummy' video driver.
+
+The full-resolution methods blur every pixel of the area, so they get slower as the radius
+grows. BLUR_BOX and BLUR_KAWASE blur a copy of the area that is scaled down by the downsample
+factor, so most of their cost is scaling the area down and back up.
+
+Usage: python benchmarks/blur.py [--radii 3 7 15 30] [--size 640 360] [--repeats 10] [--json]
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+pygame.init()
+screen = pygame.display.set_mode((800, 600))
+
+import ember
+from ember.material import Blur
+from ember.material.blur import pillow_installed
+
+METHODS = [("pygame", ember.BLUR_PYGAME, 1)]
+if pillow_installed:
+    METHODS.append(("pil", ember.BLUR_PIL, 1))
+for factor in (2, 4, 8):
+    METHODS.append((f"box/{factor}", ember.BLUR_BOX, factor))
+for factor in (2, 4, 8):
+    METHODS.append((f"kawase/{factor}", ember.BLUR_KAWASE, factor))
+
+
+def make_scene(size: tuple[int, int]) -> pygame.Surface:
+    scene = pygame.Surface(size)
+    rng = random.Random(0)
+    for _ in range(200):
+        color = [rng.randrange(256) for _ in range(3)]
+        rect = (
+            rng.randrange(size[0]),
+            rng.randrange(size[1]),
+            rng.randrange(10, 100),
+            rng.randrange(10, 100),
+        )
+        pygame.draw.rect(scene, color, rect)
+    return scene
+
+
+def time_blur(
+    method: ember.BlurMode, factor: int, radius: int, scene: pygame.Surface, repeats: int
+) -> float:
+    blur = Blur(radius, method, downsample=factor)
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        blur._render_surface(None, scene, (0, 0), scene.get_size())
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--radii", type=int, nargs="+", default=[3, 7, 15, 30])
+    parser.add_argument("--size", type=int, nargs=2, default=[640, 360])
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    scene = make_scene(tuple(args.size))
+    results = [
+        {
+            "radius": radius,
+            **{
+                f"{name}_ms": time_blur(method, factor, radius, scene, args.repeats) * 1000
+                for name, method, factor in METHODS
+            },
+        }
+        for radius in args.radii
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'radius':>8}" + "".join(f"{name + ' (ms)':>16}" for name, _, _ in METHODS))
+    for result in results:
+        print(
+            f"{result['radius']:>8}"
+            + "".join(f"{result[name + '_ms']:>16.2f}" for name, _, _ in METHODS)
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""
+Grid benchmarks. Runs headless, using the SDL 'dummy' video driver.
+
+Builds an inventory grid of fixed-size cells and times:
+
+- pack: packing the cells into rows with the single-pass algorithm.
+- search: packing the cells into rows by trying fewer and fewer cells on each row. This is
+  the algorithm the Grid used for every layout before, and still uses for Fill sizes.
+- first_layout: the first View.update.
+- resize: changing the width of the Grid, which packs the rows again, and the View.update
+  after it.
+- set_text: changing the text of one cell, which reuses the row plan, and the View.update
+  after it.
+- render: a View.update with no layout changes.
+
+Each change is timed together with the following View.update, as some changes do part of their
+work straight away rather than in the update.
+
+The search phase is slow for large grids, so it can be skipped with --no-search.
+
+Usage: python benchmarks/grid.py [--cells 5000] [--repeats 10] [--no-search] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Callable
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+pygame.init()
+screen = pygame.display.set_mode((800, 600))
+
+import ember
+from ember.style import pixel_dark as ui
+
+ember.init()
+ember.set_clock(pygame.time.Clock())
+
+
+def time_call(func, *args, **kwargs) -> float:
+    start = time.perf_counter()
+    func(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def time_update(view: ember.ui.View, change: Callable[[], None]) -> float:
+    start = time.perf_counter()
+    change()
+    view.update(screen)
+    return time.perf_counter() - start
+
+
+def run(cells: int, repeats: int, search: bool) -> dict:
+    with ember.View() as view:
+        with ui.Grid(w=780, h=580, spacing=4) as grid:
+            items = [ui.Text(str(i), w=36, h=36) for i in range(cells)]
+
+    results = {"cells": cells, "first_layout_ms": time_call(view.update, screen) * 1000}
+
+    elements = list(grid._child_elements)
+    spacing = grid.spacing2.get_min()
+    results["rows"] = len(grid._pack_rows(elements, spacing))
+    results["pack_ms"] = (
+        statistics.median(
+            time_call(grid._pack_rows, elements, spacing) for _ in range(repeats)
+        )
+        * 1000
+    )
+    if search:
+        results["search_ms"] = time_call(grid._search_rows, elements, spacing) * 1000
+
+    resize = []
+    for i in range(repeats):
+        resize.append(time_update(view, lambda: setattr(grid, "w", 780 - (i % 2) * 100)))
+    results["resize_ms"] = statistics.median(resize) * 1000
+
+    set_text = []
+    for i in range(repeats):
+        set_text.append(time_update(view, lambda: items[i].set_text(str(-i))))
+    results["set_text_ms"] = statistics.median(set_text) * 1000
+
+    results["render_ms"] = (
+        statistics.median(
+            time_call(view.update, screen, render=True) for _ in range(repeats)
+        )
+        * 1000
+    )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--cells", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument(
+        "--no-search", action="store_true", help="Skip the search phase."
+    )
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    results = run(args.cells, args.repeats, not args.no_search)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, value in results.items():
+        print(f"{name:<16}" + (f"{value:>12}" if isinstance(value, int) else f"{value:>12.2f}"))
+
+
+if __name__ == "__main__":
+    main()
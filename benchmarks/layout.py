@@ -0,0 +1,188 @@
+"""
+Layout benchmarks. Runs headless, using the SDL 'dummy' video driver.
+
+Each scenario builds an element tree and times:
+
+- build: constructing the View and its elements.
+- first_layout: the first View.update, which builds the elements and calculates their rects.
+- set_text: calling Text.set_text on one leaf element, and the View.update after it.
+- resize: changing the w trait of one leaf element, and the View.update after it.
+- append: appending an element to a container, and the View.update after it.
+- render: a View.update with no layout changes.
+
+Each change is timed together with the following View.update, as some changes do part of their
+work straight away rather than in the update.
+
+The incremental phases are repeated, and the median time is reported.
+
+Usage: python benchmarks/layout.py [--scale 1.0] [--repeats 10] [--scenario NAME ...] [--json] [--output FILE]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from typing import Callable, NamedTuple, Optional
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+pygame.init()
+screen = pygame.display.set_mode((800, 600))
+
+import ember
+from ember.style import pixel_dark as ui
+
+ember.init()
+ember.set_clock(pygame.time.Clock())
+
+
+class Scenario(NamedTuple):
+    view: ember.ui.View
+    text: ember.ui.Text
+    container: ember.ui.MultiElementContainer
+
+
+def deep_vstack(size: int) -> Scenario:
+    text = ui.Text("Bottom")
+    stack = innermost = ui.VStack(text)
+    for i in range(size):
+        stack = ui.VStack(ui.Text(f"Depth {i}"), stack)
+    return Scenario(ember.View(stack), text, innermost)
+
+
+def wide_hstack(size: int) -> Scenario:
+    with ember.View() as view:
+        with ui.HStack(spacing=2) as stack:
+            for i in range(size):
+                text = ui.Text(str(i))
+    return Scenario(view, text, stack)
+
+
+def grid(size: int) -> Scenario:
+    with ember.View() as view:
+        with ui.Grid(w=780, h=580, wrap_length=50) as container:
+            for i in range(size):
+                text = ui.Text(str(i))
+    return Scenario(view, text, container)
+
+
+def scroll_list(size: int) -> Scenario:
+    with ember.View() as view:
+        with ui.Scroll(w=300, h=500):
+            with ui.VStack(spacing=4) as stack:
+                for i in range(size):
+                    text = ui.Text(f"Row {i}")
+    return Scenario(view, text, stack)
+
+
+SCENARIOS: dict[str, tuple[Callable[[int], Scenario], int]] = {
+    "deep_vstack": (deep_vstack, 60),
+    "wide_hstack": (wide_hstack, 500),
+    "grid": (grid, 1000),
+    "scroll_list": (scroll_list, 1000),
+}
+
+
+def time_update(
+    view: ember.ui.View,
+    change: Optional[Callable[[], None]] = None,
+    render: bool = False,
+) -> float:
+    start = time.perf_counter()
+    if change is not None:
+        change()
+    view.update(screen, render=render)
+    return time.perf_counter() - start
+
+
+def run_scenario(func: Callable[[int], Scenario], size: int, repeats: int) -> dict:
+    start = time.perf_counter()
+    scenario = func(size)
+    build = time.perf_counter() - start
+
+    first_layout = time_update(scenario.view)
+
+    set_text = []
+    for i in range(repeats):
+        set_text.append(
+            time_update(
+                scenario.view, lambda: scenario.text.set_text(f"Changed text {i}")
+            )
+        )
+
+    resize = []
+    for i in range(repeats):
+        resize.append(
+            time_update(
+                scenario.view, lambda: setattr(scenario.text, "w", 40 + (i % 2) * 20)
+            )
+        )
+
+    append = []
+    for i in range(repeats):
+        append.append(
+            time_update(
+                scenario.view,
+                lambda: scenario.container.append(ui.Text(f"Appended {i}")),
+            )
+        )
+
+    render = [time_update(scenario.view, render=True) for _ in range(repeats)]
+
+    return {
+        "elements": size,
+        "build_ms": build * 1000,
+        "first_layout_ms": first_layout * 1000,
+        "set_text_ms": statistics.median(set_text) * 1000,
+        "resize_ms": statistics.median(resize) * 1000,
+        "append_ms": statistics.median(append) * 1000,
+        "render_ms": statistics.median(render) * 1000,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--scenario", nargs="+", choices=SCENARIOS, default=list(SCENARIOS)
+    )
+    parser.add_argument(
+        "--scale", type=float, default=1, help="Multiplies the size of each scenario."
+    )
+    parser.add_argument("--repeats", type=int, default=10)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    args = parser.parse_args()
+
+    results = {}
+    for name in args.scenario:
+        func, size = SCENARIOS[name]
+        results[name] = run_scenario(func, max(1, int(size * args.scale)), args.repeats)
+
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    columns = list(next(iter(results.values())))
+    print(f"{'scenario':<14}" + "".join(f"{column:>17}" for column in columns))
+    for name, result in results.items():
+        print(
+            f"{name:<14}"
+            + "".join(
+                f"{value:>17}" if isinstance(value, int) else f"{value:>17.2f}"
+                for value in result.values()
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Compares Font.split_into_lines before and after it was changed to measure the text once.
+
+The legacy implementation measured the growing slice of the line after every character, so
+wrapping a paragraph took quadratic time. This benchmark wraps generated help text with the
+default PixelFont and with a PygameFont, and checks that both implementations give the same
+lines. Runs headless, using the SDL 'dummy' video driver.
+
+Usage: python benchmarks/line_breaking.py [--sizes 1000 10000] [--width 300] [--json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+pygame.init()
+pygame.display.set_mode((1, 1))
+
+from ember import common as _c
+from ember.font import Font, PixelFont, PygameFont
+
+WORDS = (
+    "the a of to and in element container text font surface layer view update render "
+    "stack width height position material cursor focus event scroll spacing"
+).split()
+
+
+def make_text(size: int, seed: int = 0) -> str:
+    rng = random.Random(seed)
+    words = []
+    length = 0
+    while length < size:
+        word = rng.choice(WORDS)
+        if rng.random() < 0.02:
+            word += "\n"
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size]
+
+
+def legacy(font: Font, text: str, max_width: int, variant) -> list:
+    lines = []
+    last_n = 0
+    letter_n = -1
+
+    while letter_n < len(text) - 1:
+        letter_n += 1
+        if letter_n < 0:
+            raise _c.Error("internal font error")
+
+        line_width = font.get_width_of_line(text[last_n : letter_n + 1], variant)
+
+        if line_width > max_width or text[letter_n] == "\n":
+            letter = text[letter_n]
+            space_n = letter_n
+
+            if letter == "\n":
+                this_line = text[last_n : letter_n + 1]
+
+            else:
+                if letter_n - last_n > 1:
+                    while True:
+                        space_n -= 1
+                        if text[space_n] == " ":
+                            letter_n = space_n
+                            break
+                        if space_n - last_n <= 1:
+                            letter_n -= 1
+                            break
+
+                this_line = text[last_n : letter_n + 1]
+
+            if this_line[-1] in {" ", "\n"}:
+                this_line = this_line[:-1]
+
+            lines.append((last_n, this_line))
+            last_n = letter_n + 1
+
+        if letter_n >= len(text) - 1:
+            lines.append((last_n, text[last_n:]))
+    return lines
+
+
+def current(font: Font, text: str, max_width: int, variant) -> list:
+    return list(font.split_into_lines(text, max_width, variant))
+
+
+def run(func, font: Font, text: str, max_width: int, repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(font, text, max_width, ())
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--width", type=int, default=300)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    fonts = {
+        "PixelFont": PixelFont(
+            os.path.join(os.path.dirname(__file__), "..", "src", "ember", "default_fonts", "pixel")
+        ),
+        "PygameFont": PygameFont(pygame.font.Font(None, 20)),
+    }
+
+    results = []
+    for name, font in fonts.items():
+        for size in args.sizes:
+            text = make_text(size)
+            assert legacy(font, text, args.width, ()) == current(
+                font, text, args.width, ()
+            )
+            results.append(
+                {
+                    "font": name,
+                    "characters": size,
+                    "legacy_ms": run(legacy, font, text, args.width, args.repeats) * 1000,
+                    "current_ms": run(current, font, text, args.width, args.repeats) * 1000,
+                }
+            )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'font':<12} {'characters':>10} {'legacy (ms)':>12} {'current (ms)':>13} {'speedup':>9}")
+    for result in results:
+        print(
+            f"{result['font']:<12} {result['characters']:>10} {result['legacy_ms']:>12.2f} "
+            f"{result['current_ms']:>13.2f} "
+            f"{result['legacy_ms'] / result['current_ms']:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
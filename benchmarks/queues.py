@@ -0,0 +1,103 @@
+"""
+Compares the ViewLayer update queues before and after they were replaced with DepthQueue.
+
+The legacy implementation stored queued elements in a list, checked membership with a linear
+search, and sorted the list by depth before every pop(0). This benchmark queues N elements
+at random depths and then drains the queue, as ViewLayer._process_queues does.
+
+Usage: python benchmarks/queues.py [--sizes 1000 10000] [--json]
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+from ember.utility.depth_queue import DepthQueue
+
+
+class FakeElement:
+    def __init__(self, depth: int) -> None:
+        self.ancestry = [None] * depth
+
+
+def make_elements(count: int, seed: int = 0) -> list[FakeElement]:
+    rng = random.Random(seed)
+    elements = [FakeElement(rng.randint(0, 12)) for _ in range(count)]
+    # Elements are often queued more than once in a tick
+    return elements + rng.sample(elements, count // 4)
+
+
+def legacy(elements: list[FakeElement]) -> int:
+    queue = []
+    for element in elements:
+        if element not in queue:
+            queue.append(element)
+
+    popped = 0
+    while queue:
+        queue.sort(key=lambda a: len(a.ancestry))
+        queue.pop(0)
+        popped += 1
+    return popped
+
+
+def depth_queue(elements: list[FakeElement]) -> int:
+    queue = DepthQueue()
+    for element in elements:
+        queue.append(element)
+
+    popped = 0
+    while queue:
+        queue.pop()
+        popped += 1
+    return popped
+
+
+def run(func, elements: list[FakeElement], repeats: int) -> float:
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(elements)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        elements = make_elements(size)
+        assert legacy(elements) == depth_queue(elements) == size
+        results.append(
+            {
+                "elements": size,
+                "legacy_ms": run(legacy, elements, args.repeats) * 1000,
+                "depth_queue_ms": run(depth_queue, elements, args.repeats) * 1000,
+            }
+        )
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'elements':>10} {'legacy (ms)':>14} {'DepthQueue (ms)':>16} {'speedup':>9}")
+    for result in results:
+        print(
+            f"{result['elements']:>10} {result['legacy_ms']:>14.2f} "
+            f"{result['depth_queue_ms']:>16.2f} "
+            f"{result['legacy_ms'] / result['depth_queue_ms']:>8.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Compares appending lines to a Text element with appending them to a TextLog. Runs headless,
+using the SDL 'dummy' video driver.
+
+For each buffer size, the element is filled with that many lines, then the time taken to
+append one more line and update the View is measured. Setting the text of a Text wraps and
+renders the whole buffer, so it gets slower as the buffer grows. A TextLog only renders the
+new line.
+
+Usage: python benchmarks/text_log.py [--sizes 100 1000 5000] [--repeats 20] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+pygame.init()
+screen = pygame.display.set_mode((800, 600))
+
+import ember
+from ember.style import pixel_dark as ui
+
+ember.init()
+ember.set_clock(pygame.time.Clock())
+
+
+def make_line(n: int) -> str:
+    if n % 5 == 0:
+        return f"[{n}] player{n % 7} picked up an item and said something long enough to wrap"
+    return f"[{n}] player{n % 7} joined"
+
+
+def time_text(size: int, repeats: int) -> float:
+    lines = [make_line(i) for i in range(size)]
+    with ember.View() as view:
+        text = ui.Text("\n".join(lines), w=380)
+    view.update(screen)
+
+    times = []
+    for i in range(repeats):
+        lines.append(make_line(size + i))
+        start = time.perf_counter()
+        text.set_text("\n".join(lines))
+        view.update(screen)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def time_text_log(size: int, repeats: int) -> float:
+    with ember.View() as view:
+        text_log = ui.TextLog(
+            [make_line(i) for i in range(size)], max_lines=size + repeats, w=380, h=580
+        )
+    view.update(screen)
+
+    times = []
+    for i in range(repeats):
+        start = time.perf_counter()
+        text_log.append_line(make_line(size + i))
+        view.update(screen)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000])
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--json", action="store_true", help="Print results as JSON.")
+    args = parser.parse_args()
+
+    results = [
+        {
+            "lines": size,
+            "text_ms": time_text(size, args.repeats) * 1000,
+            "text_log_ms": time_text_log(size, args.repeats) * 1000,
+        }
+        for size in args.sizes
+    ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"{'lines':>8} {'Text (ms)':>12} {'TextLog (ms)':>14}")
+    for result in results:
+        print(
+            f"{result['lines']:>8} {result['text_ms']:>12.2f} {result['text_log_ms']:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,8 @@ from .common import (
     BlurMode,
     BLUR_PIL,
     BLUR_PYGAME,
+    BLUR_BOX,
+    BLUR_KAWASE,
     FocusDirection,
     package,
     VERSION
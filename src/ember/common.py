@@ -39,6 +39,9 @@ class BlurMode:
 
 BLUR_PIL = BlurMode()
 BLUR_PYGAME = BlurMode()
+# Blur a downsampled copy of the area, which is faster but less accurate
+BLUR_BOX = BlurMode()
+BLUR_KAWASE = BlurMode()
 
 
 class FocusDirection(Enum):
@@ -96,3 +99,14 @@ joysticks: list[pygame.joystick.Joystick] = []
 
 audio_enabled: bool = False
 audio_muted: bool = False
+
+
+def set_cursor(cursor: int) -> None:
+    """
+    Set the system cursor. Does nothing if the video driver doesn't support system cursors,
+    such as the SDL 'dummy' driver used when running headless.
+    """
+    try:
+        pygame.mouse.set_cursor(cursor)
+    except pygame.error:
+        pass
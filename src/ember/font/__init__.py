@@ -5,4 +5,6 @@ from .ttf_font import PygameFont
 from .icon_font import IconFont
 
 from .line import Line
+from .render_cache import RenderCache, render_cache
+from .metrics_cache import MetricsCache, metrics_cache
 from .variant import *
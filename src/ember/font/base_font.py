@@ -1,8 +1,10 @@
 import abc
+import bisect
 import math
+from collections import OrderedDict
 
 import pygame
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Callable
 
 from .. import common as _c
 
@@ -11,6 +13,9 @@ from ember.position.position import Position
 from .line import Line
 from .variant import TextVariant
 
+# The number of widths remembered by Font.get_width_of
+FIT_WIDTH_CACHE_SIZE = 256
+
 
 class Font(abc.ABC):
     def __init__(
@@ -26,6 +31,9 @@ class Font(abc.ABC):
         self.cursor: pygame.Surface = cursor
         self.cursor_offset: Sequence[int] = cursor_offset
 
+        # The widths found by get_width_of for each text, variant and max height
+        self._fit_widths: OrderedDict[tuple, int] = OrderedDict()
+
     @abc.abstractmethod
     def get_width_of_line(self, text: str, variant: Sequence[TextVariant]) -> int:
         pass
@@ -41,34 +49,73 @@ class Font(abc.ABC):
         if (w := self.get_width_of_line(text, variant)) < max_width:
             return w
 
-        width = 10
-        while True:
-            width += 1
-            if (h := self.get_height_of(text, max_width=width)) <= max_height:
-                return width
-
-    def get_height_of(self, text: str, max_width: float) -> int:
+        key = (text, tuple(variant), max_height)
+        if (width := self._fit_widths.get(key)) is not None:
+            self._fit_widths.move_to_end(key)
+            return width
+
+        # The height of the text only decreases as the width increases, so the narrowest width
+        # that fits in the max height can be bisected. If the text can't fit in the max height,
+        # the width of the text on one line is used.
+        widths = range(11, max(11, w) + 1)
+        width = widths[
+            min(
+                len(widths) - 1,
+                bisect.bisect_left(
+                    widths,
+                    True,
+                    key=lambda i: self.get_height_of(text, i, variant) <= max_height,
+                ),
+            )
+        ]
+
+        self._fit_widths[key] = width
+        if len(self._fit_widths) > FIT_WIDTH_CACHE_SIZE:
+            self._fit_widths.popitem(last=False)
+        return width
+
+    def get_height_of(
+        self, text: str, max_width: float, variant: Sequence[TextVariant] = ()
+    ) -> int:
         if max_width == 0:
             return 0
 
-        lines = [i for i in self.split_into_lines(text, max_width)]
+        lines = [i for i in self.split_into_lines(text, max_width, variant)]
         return len(lines) * (self.line_height + self.line_spacing) - self.line_spacing
     
     def get_layers(self, variant: Sequence[TextVariant]) -> list[int]:
         return [1]
 
+    def _get_width_measurer(
+        self, text: str, variant: Sequence[TextVariant]
+    ) -> Callable[[int, int], int]:
+        """
+        Returns a function that takes a start and stop index, and returns the width of that slice
+        of the text. Subclasses can override this to measure the text once, rather than measuring
+        each slice separately.
+        """
+        return lambda start, stop: self.get_width_of_line(text[start:stop], variant)
+
     def split_into_lines(self, text, max_width, variant: Sequence[TextVariant]):
+        measure = self._get_width_measurer(text, variant)
+
         last_n = 0
         letter_n = -1
 
         while letter_n < len(text) - 1:
-            letter_n += 1
-            if letter_n < 0:
-                raise _c.Error("internal font error")
-
-            line_width = self.get_width_of_line(text[last_n : letter_n + 1], variant)
-
-            if line_width > max_width or text[letter_n] == "\n":
+            newline_n = text.find("\n", letter_n + 1)
+            if newline_n == -1:
+                newline_n = len(text)
+
+            # Find the first letter that makes the line wider than the max width. The width of
+            # the line only grows as letters are added to it, so the letters can be bisected.
+            letter_n = bisect.bisect_left(
+                range(letter_n + 1, newline_n),
+                True,
+                key=lambda n: measure(last_n, n + 1) > max_width,
+            ) + letter_n + 1
+
+            if letter_n < len(text):
                 letter = text[letter_n]
                 space_n = letter_n
 
@@ -93,9 +140,8 @@ class Font(abc.ABC):
 
                 yield last_n, this_line
                 last_n = letter_n + 1
-
-                #if letter == "\n" and letter_n == len(text) - 1:
-                    #yield last_n, ""
+            else:
+                letter_n = len(text) - 1
 
             if letter_n >= len(text) - 1:
                 yield last_n, text[last_n:]
@@ -108,4 +154,78 @@ class Font(abc.ABC):
         max_width: Optional[int],
         align: Position,
     ) -> tuple[list[pygame.Surface], [Line]]:
-        pass
\ No newline at end of file
+        pass
+
+    def render_incrementally(
+        self,
+        text: str,
+        variant: Sequence[TextVariant],
+        max_width: Optional[int],
+        align: Position,
+        previous_text: str,
+        previous_surfaces: Sequence[pygame.Surface],
+        previous_lines: Sequence[Line],
+    ) -> tuple[list[pygame.Surface], [Line]]:
+        """
+        Returns the same result as :code:`render`, given the result of rendering
+        :code:`previous_text` with the same variant, max width and alignment. The lines before
+        the first character that changed are copied from the previous surfaces, and only the
+        rest of the text is wrapped and rendered.
+        """
+        if max_width is None or not previous_text:
+            return self.render(text, variant, max_width, align)
+
+        # Find the length of the common prefix by comparing slices, which is faster than
+        # comparing the letters one at a time
+        low, high = 0, min(len(text), len(previous_text))
+        while low < high:
+            mid = (low + high + 1) // 2
+            if text[:mid] == previous_text[:mid]:
+                low = mid
+            else:
+                high = mid - 1
+        prefix = low
+
+        # Where a line is broken can depend on the letters up to the start of the line after
+        # next, so a line is only reused if that line starts before the first change
+        reused = max(
+            0, bisect.bisect_left(previous_lines, prefix, key=lambda i: i.start_index) - 2
+        )
+        start = previous_lines[reused].start_index if reused else 0
+        if not reused or start >= len(text):
+            return self.render(text, variant, max_width, align)
+
+        tail_surfaces, tail_lines = self.render(text[start:], variant, max_width, align)
+        head_height = reused * (self.line_height + self.line_spacing)
+
+        surfaces = []
+        for previous_surface, tail_surface in zip(previous_surfaces, tail_surfaces):
+            surface = pygame.Surface(
+                (tail_surface.get_width(), head_height + tail_surface.get_height()),
+                pygame.SRCALPHA,
+            )
+            # The surface is transparent, so these copy the pixels exactly
+            surface.blit(
+                previous_surface,
+                (0, 0),
+                (0, 0, previous_surface.get_width(), head_height),
+                special_flags=pygame.BLEND_RGBA_MAX,
+            )
+            surface.blit(
+                tail_surface, (0, head_height), special_flags=pygame.BLEND_RGBA_MAX
+            )
+            surfaces.append(surface)
+
+        lines = list(previous_lines[:reused])
+        for line in tail_lines:
+            lines.append(
+                Line(
+                    content=line.content,
+                    start_x=line.start_x,
+                    start_y=line.start_y,
+                    width=line.width,
+                    start_index=line.start_index + start,
+                    line_index=line.line_index + reused,
+                )
+            )
+        return surfaces, lines
\ No newline at end of file
@@ -1,28 +1,100 @@
 import pygame
 import difflib
+import json
 import os
+from collections import OrderedDict
 from os import PathLike
 from pathlib import Path
-from typing import Union, Sequence
+from typing import Union, Sequence, Optional
+
+from .. import log
+
+# The suffixes of the files containing the second and third layers of an icon
+LAYER_SUFFIXES = ("_b", "_c")
 
 
 class IconFont:
-    def __init__(self, path: Union[str, PathLike]):
+    """
+    A collection of icons, read from the :code:`icons` directory of the given path.
+
+    If the path also contains a bundle made with :py:meth:`pack_bundle`, the icons are read
+    from the bundle instead, so that every icon is loaded with a single file read.
+    """
+
+    def __init__(self, path: Union[str, PathLike], cache_size: int = 64):
         if isinstance(path, str):
             path = Path(path)
         self.path: PathLike = path
 
-        self.icon_names = []
-        self.layer_names = []
+        self.cache_size: int = cache_size
+        """
+        The number of icons to keep decoded. When more icons than this have been used, the
+        least recently used icons are removed from the cache.
+        """
+
+        self._icon_names: Optional[list[str]] = None
+        self._layer_names: Optional[list[str]] = None
+
+        self._cache: OrderedDict[str, tuple[pygame.Surface, ...]] = OrderedDict()
+
+        self._manifest: Optional[dict[str, list[list[int]]]] = None
+        self._atlas: Optional[pygame.Surface] = None
+
+        bundle_path = self.path / "icons.json"
+        if bundle_path.is_file():
+            with open(bundle_path, "r", encoding="utf-8") as f:
+                self._manifest = json.load(f)["icons"]
+
+    def __repr__(self) -> str:
+        return f"<IconFont({self.path})>"
+
+    def _list_icons(self) -> None:
+        self._icon_names = []
+        self._layer_names = []
+
+        if self._manifest is not None:
+            for name, rects in self._manifest.items():
+                self._icon_names.append(name)
+                self._layer_names.extend(
+                    f"{name}{suffix}" for suffix in LAYER_SUFFIXES[: len(rects) - 1]
+                )
+            return
 
         for i in os.listdir(self.path / "icons"):
             if i.endswith(".png"):
                 if not (i.endswith("_b.png") or i.endswith("_c.png")):
-                    self.icon_names.append(i[:-4])
+                    self._icon_names.append(i[:-4])
                 else:
-                    self.layer_names.append(i[:-4])
+                    self._layer_names.append(i[:-4])
+
+    @property
+    def icon_names(self) -> list[str]:
+        """
+        The names of the icons in the font. The icons directory is listed the first time this
+        is accessed. Read-only.
+        """
+        if self._icon_names is None:
+            self._list_icons()
+        return self._icon_names
+
+    @property
+    def layer_names(self) -> list[str]:
+        """
+        The names of the files containing the second and third layers of the icons. Read-only.
+        """
+        if self._layer_names is None:
+            self._list_icons()
+        return self._layer_names
 
     def get(self, name: str) -> Sequence[pygame.Surface]:
+        """
+        Returns a surface for each layer of the icon. The surfaces are cached and shared between
+        every caller, so they must not be modified. Copy a surface before drawing on it.
+        """
+        if (surfaces := self._cache.get(name)) is not None:
+            self._cache.move_to_end(name)
+            return surfaces
+
         if name not in self.icon_names:
             msg = f"No icon named '{name}' was found."
 
@@ -32,21 +104,96 @@ class IconFont:
 
             raise ValueError(msg)
 
-        if f"{name}_b" in self.layer_names:
-            if f"{name}_c" in self.layer_names:
-                return (
-                    pygame.image.load(self.path / f"icons/{name}.png").convert_alpha(),
-                    pygame.image.load(
-                        self.path / f"icons/{name}_b.png"
-                    ).convert_alpha(),
-                    pygame.image.load(
-                        self.path / f"icons/{name}_c.png"
-                    ).convert_alpha(),
-                )
+        surfaces = self._load(name)
+        if self.cache_size > 0:
+            self._cache[name] = surfaces
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return surfaces
+
+    def _load(self, name: str) -> tuple[pygame.Surface, ...]:
+        if self._manifest is not None:
+            if self._atlas is None:
+                log.font.info("Loading icon bundle.", self)
+                self._atlas = pygame.image.load(self.path / "icons.png").convert_alpha()
+            return tuple(self._atlas.subsurface(rect) for rect in self._manifest[name])
+
+        return tuple(
+            pygame.image.load(self.path / f"icons/{i}.png").convert_alpha()
+            for i in self._get_file_names(name)
+        )
+
+    def _get_file_names(self, name: str) -> list[str]:
+        names = [name] + [
+            f"{name}{suffix}"
+            for suffix in LAYER_SUFFIXES
+            if f"{name}{suffix}" in self.layer_names
+        ]
+        # A third layer is only used if there is a second layer
+        if len(names) == 2 and names[1].endswith("_c"):
+            names.pop()
+        return names
+
+    def clear_cache(self) -> None:
+        """
+        Remove every icon from the cache.
+        """
+        self._cache.clear()
+
+    def pack_bundle(self, max_width: int = 1024) -> None:
+        """
+        Pack every icon in the :code:`icons` directory into a single image, :code:`icons.png`,
+        and write the position of each icon to :code:`icons.json`. Both files are written to the
+        path of the IconFont. Once the bundle exists, IconFonts created with this path read their
+        icons from it. Pack the bundle again after changing the icons.
 
-            return (
-                pygame.image.load(self.path / f"icons/{name}.png").convert_alpha(),
-                pygame.image.load(self.path / f"icons/{name}_b.png").convert_alpha(),
+        The display doesn't need to be initialised to pack a bundle, so this can be run as part
+        of a build step.
+        """
+        self._manifest = None
+        self._list_icons()
+
+        # Place the layers of each icon side by side, and the icons in rows
+        surfaces = {}
+        manifest = {}
+        x = y = row_height = width = 0
+        for name in sorted(self._icon_names):
+            layers = [
+                pygame.image.load(self.path / f"icons/{i}.png")
+                for i in self._get_file_names(name)
+            ]
+            icon_width = sum(i.get_width() for i in layers)
+
+            if x and x + icon_width > max_width:
+                x = 0
+                y += row_height
+                row_height = 0
+
+            rects = []
+            for layer in layers:
+                rect = pygame.Rect((x, y), layer.get_size())
+                surfaces[tuple(rect)] = layer
+                rects.append(list(rect))
+                x += rect.w
+                row_height = max(row_height, rect.h)
+            width = max(width, x)
+            manifest[name] = rects
+
+        atlas = pygame.Surface((max(1, width), max(1, y + row_height)), pygame.SRCALPHA)
+        for rect, layer in surfaces.items():
+            # The atlas is transparent, so this copies the layer exactly
+            atlas.blit(
+                layer.convert(atlas), rect[:2], special_flags=pygame.BLEND_RGBA_MAX
             )
 
-        return (pygame.image.load(self.path / f"icons/{name}.png").convert_alpha(),)
+        pygame.image.save(atlas, self.path / "icons.png")
+        with open(self.path / "icons.json", "w", encoding="utf-8") as f:
+            json.dump({"icons": manifest}, f)
+
+        log.font.info(f"Packed {len(manifest)} icons into a bundle.", self)
+
+        self._manifest = manifest
+        self._atlas = None
+        self._icon_names = None
+        self._layer_names = None
+        self._cache.clear()
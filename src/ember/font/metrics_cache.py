@@ -0,0 +1,171 @@
+import os
+import sys
+import json
+import tempfile
+import threading
+import pygame
+from os import PathLike
+from pathlib import Path
+
+from typing import Optional, Union, Any
+
+from .. import log
+
+
+class MetricsCache:
+    """
+    An on-disk cache of the glyph and layer positions read from PixelFont sheets. Each entry
+    is keyed by the path of the sheet, and is only used if the size and modification time of
+    the file haven't changed since it was scanned.
+
+    The cache is stored as a single JSON file at :code:`path`. Set :code:`path` to :code:`None`
+    to disable it.
+    """
+
+    def __init__(self, path: Union[str, PathLike, None] = None) -> None:
+        self.path: Optional[Path] = Path(path) if path is not None else None
+        """
+        The path of the JSON file that the cache is stored in.
+        """
+
+        self._entries: Optional[dict[str, dict[str, Any]]] = None
+        # Sheets can be read by PixelFont.preload on a worker thread
+        self._lock: threading.Lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<MetricsCache({self.path})>"
+
+    @staticmethod
+    def _stat(sheet_path: Path) -> Optional[tuple[str, int, int]]:
+        try:
+            stat = sheet_path.stat()
+            return str(sheet_path.resolve()), stat.st_size, stat.st_mtime_ns
+        except OSError:
+            return None
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            self._entries = {}
+            if self.path is not None and self.path.is_file():
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        entries = json.load(f)
+                    if isinstance(entries, dict):
+                        self._entries = entries
+                except (OSError, ValueError) as e:
+                    log.font.info(f"Couldn't read metrics cache '{self.path}': {e}")
+        return self._entries
+
+    def get(
+        self,
+        sheet_path: Path,
+        separator_color: pygame.Color,
+        sheet_size: tuple[int, int],
+    ) -> Optional[dict[str, Any]]:
+        """
+        Returns the metrics stored for the sheet, or :code:`None` if there aren't any, the
+        sheet has changed since they were stored, or the entry is malformed. :code:`sheet_size`
+        is the size of the loaded sheet, which every stored rect must fit inside.
+        """
+        if self.path is None or (stat := self._stat(sheet_path)) is None:
+            return None
+        key, size, mtime = stat
+        with self._lock:
+            entry = self._read().get(key)
+        if (
+            not isinstance(entry, dict)
+            or entry.get("size") != size
+            or entry.get("mtime") != mtime
+            or entry.get("separator_color") != list(separator_color)
+        ):
+            return None
+        if not self._is_valid(metrics := entry.get("metrics"), sheet_size):
+            log.font.info(f"Ignoring malformed metrics cache entry for '{sheet_path}'.")
+            return None
+        return metrics
+
+    @staticmethod
+    def _is_valid(metrics: Any, sheet_size: tuple[int, int]) -> bool:
+        """
+        Returns True if the metrics have the structure returned by VariantData._scan, and every
+        span lies inside the sheet.
+        """
+
+        def is_span(value: Any, length: int) -> bool:
+            return (
+                isinstance(value, (list, tuple))
+                and len(value) == 2
+                and all(type(i) is int and i >= 0 for i in value)
+                and value[0] + value[1] <= length
+            )
+
+        width, height = sheet_size
+        return (
+            isinstance(metrics, dict)
+            and isinstance(layers := metrics.get("layers"), list)
+            and len(layers) > 0
+            and all(is_span(i, height) for i in layers)
+            and (metrics.get("unknown") is None or is_span(metrics["unknown"], width))
+            and isinstance(characters := metrics.get("characters"), list)
+            and all(is_span(i, width) for i in characters)
+        )
+
+    def set(
+        self,
+        sheet_path: Path,
+        separator_color: pygame.Color,
+        metrics: dict[str, Any],
+    ) -> None:
+        """
+        Store the metrics of the sheet, and write the cache to disk.
+        """
+        if self.path is None or (stat := self._stat(sheet_path)) is None:
+            return
+        key, size, mtime = stat
+        with self._lock:
+            self._read()[key] = {
+                "size": size,
+                "mtime": mtime,
+                "separator_color": list(separator_color),
+                "metrics": metrics,
+            }
+            try:
+                # The cache directory is private to the user, so other users can't change it
+                self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+                # Write to a temporary file first, so that the cache is never left half-written
+                with tempfile.NamedTemporaryFile(
+                    "w", encoding="utf-8", dir=self.path.parent, delete=False
+                ) as f:
+                    json.dump(self._entries, f)
+                os.replace(f.name, self.path)
+            except OSError as e:
+                log.font.info(f"Couldn't write metrics cache '{self.path}': {e}")
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache, and delete the cache file.
+        """
+        with self._lock:
+            self._entries = {}
+            if self.path is not None:
+                try:
+                    self.path.unlink(missing_ok=True)
+                except OSError as e:
+                    log.font.info(f"Couldn't delete metrics cache '{self.path}': {e}")
+
+
+def _get_cache_dir() -> Path:
+    """
+    Returns the directory that the current user's caches are stored in on this platform.
+    """
+    if os.name == "nt":
+        return Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    if sys.platform == "darwin":
+        return Path.home() / "Library" / "Caches"
+    return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+
+
+metrics_cache: MetricsCache = MetricsCache(_get_cache_dir() / "ember" / "font_metrics.json")
+"""
+The MetricsCache used when loading :py:class:`PixelFont<ember.font.PixelFont>` sheets.
+"""
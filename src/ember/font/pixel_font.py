@@ -1,9 +1,11 @@
+import itertools
+import threading
 import pygame
 from os import PathLike
 import json
 from pathlib import Path
 
-from typing import Sequence, Optional, Union
+from typing import Sequence, Optional, Union, Callable
 
 from ..common import ColorType
 from .base_font import Font
@@ -89,6 +91,9 @@ class PixelFont(Font):
         A string containing every character supported by the PixelFont.
         """
 
+        # The name of the glyph used for each character that has been read
+        self._char_names: dict[str, str] = {}
+
         self.variants: dict[Sequence[TextVariant], VariantData] = {}
         for f in files:
             if "variant" in f:
@@ -135,18 +140,68 @@ class PixelFont(Font):
             cursor_offset=_load_value(cursor_offset, data.get("cursor_offset"), [0, 0]),
         )
 
+    def preload(self, *variants: Sequence[TextVariant]) -> None:
+        """
+        Start loading the given variants on a worker thread, so that rendering text with them
+        for the first time doesn't cause a hitch. If no variants are given, every variant that
+        hasn't been loaded is preloaded.
+
+        The image is decoded and its metrics are found on the worker thread. The image is
+        converted on the main thread when the variant is first used, or when
+        :py:meth:`finish_preloading` is called. If a variant is used before the worker thread
+        has finished reading it, the main thread waits for the worker thread.
+        """
+        if variants:
+            variant_datas = [
+                self.variants[tuple(sorted(i))]
+                for i in variants
+                if tuple(sorted(i)) in self.variants
+            ]
+        else:
+            variant_datas = list(self.variants.values())
+
+        variant_datas = [
+            i for i in variant_datas if not i.has_loaded and not i.is_preloading
+        ]
+        if not variant_datas:
+            return
+
+        for variant_data in variant_datas:
+            variant_data.schedule_preload()
+
+        def preload() -> None:
+            for variant_data in variant_datas:
+                variant_data.preload()
+
+        log.font.info(f"Preloading {len(variant_datas)} variants.", self)
+        threading.Thread(target=preload, name="ember-font-preload", daemon=True).start()
+
+    def finish_preloading(self) -> bool:
+        """
+        Finish loading the variants that the worker thread started by :py:meth:`preload` has
+        read. Doesn't wait for the worker thread. Returns True if no variants are still being
+        preloaded.
+        """
+        for variant_data in self.variants.values():
+            if variant_data._preload_event is not None and not variant_data.is_preloading:
+                variant_data.load()
+        return not any(i.is_preloading for i in self.variants.values())
+
     def _read_char(self, char: str) -> str:
+        if (x := self._char_names.get(char)) is not None:
+            return x
         if char in self.characters:
-            return char
+            x = char
         elif (x := char.lower()) in self.characters or (
             x := char.upper()
         ) in self.characters:
-            return x
+            pass
         else:
-            return "unknown"
+            x = "unknown"
+        self._char_names[char] = x
+        return x
 
-    def get_width_of_line(self, text: str, variant: Sequence[TextVariant]) -> int:
-        total = 0  # -self.character_padding[0]
+    def _get_line_variant_data(self, variant: Sequence[TextVariant]) -> VariantData:
         if "variant" in self.variants:
             variant_data = self.variants[variant]
         else:
@@ -155,6 +210,11 @@ class PixelFont(Font):
         if not variant_data.has_loaded:
             with log.font.indent("Line width requested, loading variant...", self):
                 variant_data.load()
+        return variant_data
+
+    def get_width_of_line(self, text: str, variant: Sequence[TextVariant]) -> int:
+        total = 0  # -self.character_padding[0]
+        variant_data = self._get_line_variant_data(variant)
 
         for i in text:
             total += variant_data.character_sizes[self._read_char(i)][1]
@@ -164,51 +224,50 @@ class PixelFont(Font):
 
         return total
 
-    def _render_text(
-        self, text: str, width: int, variant_data: VariantData, layer_n: int
-    ) -> pygame.Surface:
-        surf = pygame.Surface((max(1, width), self.line_height), pygame.SRCALPHA)
+    def _get_width_measurer(
+        self, text: str, variant: Sequence[TextVariant]
+    ) -> Callable[[int, int], int]:
+        variant_data = self._get_line_variant_data(variant)
         offset = sum(self.character_padding) - self.kerning
 
-        x = 0  # -self.character_padding[0]
-        for letter in text:
-            surf.blit(variant_data.surfaces[self._read_char(letter)][layer_n], (x, 0))
-            x += variant_data.character_sizes[self._read_char(letter)][1] - offset
-
-        return surf
-
-    def _render_line(
-        self,
-        surfaces: list[pygame.Surface],
-        text: str,
-        max_width: float,
-        y: int,
-        height: int,
-        variant_data: VariantData,
-        align: Position,
-    ) -> tuple[int, int]:
-        width = self.get_width_of(text, variant_data)
-
-        for n in range(len(variant_data.layers)):
-            new_surf = pygame.Surface((max(1, max_width), y + height), pygame.SRCALPHA)
-            new_surf.blit(surfaces[n], (0, 0))
-
-            text_surf = self._render_text(text, width, variant_data, n)
-            text_width = text_surf.get_width()
+        # The width of each slice of the text is found from the prefix sums of the advances
+        advances = itertools.accumulate(
+            (variant_data.character_sizes[self._read_char(i)][1] - offset for i in text),
+            initial=0,
+        )
+        widths = list(advances)
+        extra = 1 + self.kerning + self.character_padding[1]
+        return lambda start, stop: widths[stop] - widths[start] + extra
 
-            x = align.get(max_width, text_width)
+    def _get_glyph_positions(
+        self, text: str, variant_data: VariantData
+    ) -> list[tuple[int, pygame.Rect]]:
+        """
+        Returns the x position of each character of the text, and the area of its glyph in the
+        atlases of the VariantData.
+        """
+        offset = sum(self.character_padding) - self.kerning
+        glyphs = variant_data.glyphs
+        positions = []
 
-            # This equalises some jittering that would otherwise be seen when
-            # resizing the Text element and keeping the content the same
-            if int(text_width % 2) == 1:
-                x -= 0.5
-            # if int(text_width % 2) == 0:
-            #     x -= 0.5
+        x = 0  # -self.character_padding[0]
+        for letter in text:
+            rect, size = glyphs[self._read_char(letter)]
+            positions.append((x, rect))
+            x += size - offset
 
-            new_surf.blit(text_surf, (x, y))
-            surfaces[n] = new_surf
+        return positions
 
-        return x, text_width
+    def _render_text(
+        self, text: str, width: int, variant_data: VariantData, layer_n: int
+    ) -> pygame.Surface:
+        surf = pygame.Surface((max(1, width), self.line_height), pygame.SRCALPHA)
+        atlas = variant_data.atlases[layer_n]
+        surf.blits(
+            [(atlas, (x, 0), rect) for x, rect in self._get_glyph_positions(text, variant_data)],
+            doreturn=False,
+        )
+        return surf
 
     def get_layers(self, variant: Sequence[TextVariant]) -> list[int]:
         if tuple(variant) in self.variants:
@@ -250,31 +309,54 @@ class PixelFont(Font):
 
         surface_width = 1 if max_width is None else max(1, max_width)
 
-        surfaces = [
-            pygame.Surface((surface_width, height), pygame.SRCALPHA)
-            for _ in variant_data.layers
-        ]
-
         if not text:
+            surfaces = [
+                pygame.Surface((surface_width, height), pygame.SRCALPHA)
+                for _ in variant_data.layers
+            ]
             return surfaces, [
                 Line(content="", start_x=int(align.get(surface_width, 0)))
             ]
 
+        # Lay out every line first, so that the surface for each layer can be created at its
+        # final size
+        layout = []
         lines = []
         y = 0
 
         for index, line in self.split_into_lines(text, max_width, variant):
-            start_x, end_x = self._render_line(
-                surfaces, line, max_width, y, height, variant_data, align
-            )
-            y += height + self.line_spacing
+            text_width = max(1, self.get_width_of_line(line, variant))
+
+            x = align.get(max_width, text_width)
+
+            # This equalises some jittering that would otherwise be seen when
+            # resizing the Text element and keeping the content the same
+            if int(text_width % 2) == 1:
+                x -= 0.5
+
+            layout.append((int(x), y, text_width, self._get_glyph_positions(line, variant_data)))
             lines.append(
                 Line(
                     content=line,
-                    start_x=start_x,
-                    width=end_x,
+                    start_x=x,
+                    width=text_width,
                     start_index=index,
                     line_index=len(lines),
                 )
             )
+            y += height + self.line_spacing
+
+        surfaces = []
+        for atlas in variant_data.atlases:
+            surf = pygame.Surface((surface_width, y - self.line_spacing), pygame.SRCALPHA)
+            for x, line_y, text_width, positions in layout:
+                # The glyphs are clipped to the width of the line
+                surf.set_clip((x, line_y, text_width, height))
+                surf.blits(
+                    [(atlas, (x + glyph_x, line_y), rect) for glyph_x, rect in positions],
+                    doreturn=False,
+                )
+            surf.set_clip(None)
+            surfaces.append(surf)
+
         return surfaces, lines
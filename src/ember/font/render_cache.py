@@ -0,0 +1,148 @@
+import pygame
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Optional, Sequence, TYPE_CHECKING
+
+from .. import log
+from .line import Line
+from .variant import TextVariant
+
+from ember.position.position import Position
+
+if TYPE_CHECKING:
+    from .base_font import Font
+
+
+class RenderCache:
+    """
+    A cache of rendered text that is shared by every :py:class:`Text<ember.ui.Text>` element.
+    When the total size of the cached surfaces exceeds :code:`max_bytes`, the least recently
+    used entries are removed.
+
+    The surfaces returned by the cache are shared, and must not be modified. Copy a surface
+    before drawing on it.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024) -> None:
+        self._max_bytes: int = max_bytes
+
+        self.hits: int = 0
+        """
+        The number of renders that were found in the cache.
+        """
+
+        self.misses: int = 0
+        """
+        The number of renders that weren't found in the cache.
+        """
+
+        self._entries: OrderedDict[
+            tuple, tuple[tuple[pygame.Surface, ...], tuple[Line, ...], int]
+        ] = OrderedDict()
+        self._bytes: int = 0
+
+    def __repr__(self) -> str:
+        return f"<RenderCache({len(self._entries)} entries, {self._bytes} bytes)>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        The maximum total size of the cached surfaces, in bytes. Set this to 0 to disable the
+        cache. If the cache is larger than the new value, entries are removed.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self._max_bytes = value
+        self._trim()
+
+    @property
+    def bytes(self) -> int:
+        """
+        The total size of the cached surfaces, in bytes. Read-only.
+        """
+        return self._bytes
+
+    def render(
+        self,
+        font: "Font",
+        text: str,
+        variant: Sequence[TextVariant],
+        max_width: Optional[float],
+        align: Position,
+        previous: Optional[
+            tuple[str, Sequence[pygame.Surface], Sequence[Line]]
+        ] = None,
+    ) -> tuple[list[pygame.Surface], list[Line]]:
+        """
+        Returns the result of :code:`font.render` for the given arguments, rendering the text
+        only if it isn't already in the cache.
+
+        :code:`previous` can be the text, surfaces and lines of a previous render with the same
+        font, variant, max width and alignment. If the text isn't in the cache, the unchanged
+        lines at the start of the previous render are reused.
+        """
+        if not isinstance(align, Hashable) or not self._max_bytes:
+            surfaces, lines = self._render(font, text, variant, max_width, align, previous)
+            return list(surfaces), list(lines)
+
+        key = (font, text, tuple(variant), max_width, align)
+        if (entry := self._entries.get(key)) is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return list(entry[0]), list(entry[1])
+
+        self.misses += 1
+        surfaces, lines = self._render(font, text, variant, max_width, align, previous)
+        surfaces, lines = tuple(surfaces), tuple(lines)
+
+        size = sum(i.get_width() * i.get_height() * i.get_bytesize() for i in surfaces)
+        if size <= self._max_bytes:
+            self._entries[key] = (surfaces, lines, size)
+            self._bytes += size
+            self._trim()
+
+        return list(surfaces), list(lines)
+
+    @staticmethod
+    def _render(
+        font: "Font",
+        text: str,
+        variant: Sequence[TextVariant],
+        max_width: Optional[float],
+        align: Position,
+        previous: Optional[tuple[str, Sequence[pygame.Surface], Sequence[Line]]],
+    ) -> tuple[Sequence[pygame.Surface], Sequence[Line]]:
+        if previous is None:
+            return font.render(text, variant, max_width, align)
+        return font.render_incrementally(text, variant, max_width, align, *previous)
+
+    def _trim(self) -> None:
+        while self._bytes > self._max_bytes:
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self._bytes -= size
+
+    def clear(self) -> None:
+        """
+        Remove every entry from the cache.
+        """
+        log.font.info(f"Clearing render cache of {len(self._entries)} entries.")
+        self._entries.clear()
+        self._bytes = 0
+
+    def reset_counters(self) -> None:
+        """
+        Set the hit and miss counters to 0.
+        """
+        self.hits = 0
+        self.misses = 0
+
+
+render_cache: RenderCache = RenderCache()
+"""
+The RenderCache used by :py:class:`Text<ember.ui.Text>` elements.
+"""
@@ -1,5 +1,5 @@
 import pygame
-from typing import Optional, Union, TYPE_CHECKING, Sequence
+from typing import Optional, Union, TYPE_CHECKING, Sequence, Callable
 
 if TYPE_CHECKING:
     import pathlib.Path
@@ -58,6 +58,15 @@ class PygameFont(Font):
         self._font.underline = UNDERLINE in variant
         return self._font.size(text)[0]
 
+    def _get_width_measurer(
+        self, text: str, variant: Sequence[TextVariant]
+    ) -> Callable[[int, int], int]:
+        self._font.bold = BOLD in variant
+        self._font.italic = ITALIC in variant
+        self._font.underline = UNDERLINE in variant
+        size = self._font.size
+        return lambda start, stop: size(text[start:stop])[0]
+
     def _render_text(
         self,
         text: str,
@@ -65,27 +74,6 @@ class PygameFont(Font):
     ) -> pygame.Surface:
         return self._font.render(text, self.antialias, "black")
 
-    def _render_line(
-        self,
-        surf: pygame.Surface,
-        text: str,
-        max_width: int,
-        y: int,
-        height: int,
-        variant: Sequence[TextVariant],
-        align: Position,
-    ) -> (pygame.Surface, int, int):
-        old_surf = surf.copy()
-        surf = pygame.Surface((max(1, max_width), y + height), pygame.SRCALPHA)
-        surf.blit(old_surf, (0, 0))
-
-        new_text = text
-        text_surf = self._render_text(new_text, variant)
-        x = round(align.get(max_width, text_surf.get_width()))
-
-        surf.blit(text_surf, (x, y))
-        return surf, x, text_surf.get_width()
-
     def render(
         self,
         text: str,
@@ -105,29 +93,34 @@ class PygameFont(Font):
         max_width -= abs(align.value)
 
         height = self.line_height
-
-        surf = pygame.Surface(
-            (1 if max_width is None else max(1, max_width), height), pygame.SRCALPHA
-        )
+        surface_width = max(1, max_width)
 
         if not text:
-            return surf, [Line(content="", start_x=int(align.get(surf.get_width(), 0)))]
+            surf = pygame.Surface((surface_width, height), pygame.SRCALPHA)
+            return [surf], [Line(content="", start_x=int(align.get(surface_width, 0)))]
 
+        # Render each line first, so that the surface can be created at its final size
+        blits = []
         lines = []
         y = 0
 
         for index, line in self.split_into_lines(text, max_width, variant):
-            surf, start_x, end_x = self._render_line(
-                surf, line, max_width, y, height, variant, align
-            )
+            text_surf = self._render_text(line, variant)
+            x = round(align.get(max_width, text_surf.get_width()))
+            blits.append((text_surf, (x, y), (0, 0, text_surf.get_width(), height)))
             y += height + self.line_spacing
             lines.append(
                 Line(
                     content=line,
-                    start_x=start_x,
-                    width=end_x,
+                    start_x=x,
+                    width=text_surf.get_width(),
                     start_index=index,
                     line_index=len(lines),
                 )
             )
+
+        surf = pygame.Surface(
+            (surface_width, y - self.line_spacing), pygame.SRCALPHA
+        )
+        surf.blits(blits, doreturn=False)
         return [surf], lines
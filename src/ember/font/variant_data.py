@@ -1,4 +1,5 @@
 import time
+import threading
 
 import pygame
 from os import PathLike
@@ -7,6 +8,7 @@ from pathlib import Path
 from typing import Optional, Union
 
 from .. import log
+from .metrics_cache import metrics_cache
 
 
 class VariantData:
@@ -27,11 +29,70 @@ class VariantData:
         self.surfaces: dict[str, list[pygame.Surface]] = {}
         self.character_sizes: dict[str, tuple[int, int]] = {}
 
+        self.atlases: list[pygame.Surface] = []
+        """
+        A surface for each layer, containing the glyphs of every character side by side.
+        """
+
+        self.glyphs: dict[str, tuple[pygame.Rect, int]] = {}
+        """
+        The area of each character in the atlases, and the width of the character.
+        """
+
         self.raw_layers: Optional[list[int]] = raw_layers
         self.layers: list[int] = []
 
         self.has_loaded: bool = False
 
+        # Set by the worker thread when the sheet has been read by VariantData.preload
+        self._preload_event: Optional[threading.Event] = None
+        self._preloaded: Optional[tuple[pygame.Surface, dict, str]] = None
+
+    @property
+    def is_preloading(self) -> bool:
+        """
+        Whether the variant is waiting to be read, or being read, by a worker thread. Read-only.
+        """
+        return self._preload_event is not None and not self._preload_event.is_set()
+
+    def _read(self) -> tuple[pygame.Surface, dict, str]:
+        """
+        Load the sheet and find its metrics. Doesn't convert the sheet, so it can be called
+        from any thread.
+        """
+        sheet = pygame.image.load(self.path)
+
+        metrics = metrics_cache.get(self.path, self.separator_color, sheet.get_size())
+        if metrics is None:
+            metrics = self._scan(sheet)
+            metrics_cache.set(self.path, self.separator_color, metrics)
+            return sheet, metrics, "scanned"
+        return sheet, metrics, "cached"
+
+    def schedule_preload(self) -> None:
+        """
+        Mark the variant as waiting to be preloaded. Must be called on the main thread before
+        :py:meth:`preload` is called on the worker thread, so that :py:meth:`load` knows to wait
+        for it.
+        """
+        if not self.has_loaded and self._preload_event is None:
+            self._preload_event = threading.Event()
+
+    def preload(self) -> None:
+        """
+        Read the sheet on a worker thread. The rest of the work, which must happen on the main
+        thread, is done when :py:meth:`load` is next called.
+        """
+        if self._preload_event is None or self._preload_event.is_set():
+            return
+        try:
+            self._preloaded = self._read()
+        except Exception as e:
+            # The sheet is read again by VariantData.load, which raises the error
+            log.font.info(f"Couldn't preload variant '{self.path.name}': {e}")
+        finally:
+            self._preload_event.set()
+
     def load(
         self,
     ) -> None:
@@ -41,26 +102,23 @@ class VariantData:
         start_time = time.time()
         self.has_loaded = True
 
-        sheet = pygame.image.load(self.path).convert_alpha()
-
-        layer_positions = []
-
-        size = 0
-        layer_n = 0
+        if self._preload_event is not None:
+            # Wait for the worker thread rather than reading the sheet a second time
+            self._preload_event.wait()
+            self._preload_event = None
+            preloaded, self._preloaded = self._preloaded, None
+        else:
+            preloaded = None
 
-        # Determine whether the author included a separator at y = 0 or not
-        start_y = int(sheet.get_at((1, 0)) == self.separator_color)
+        if preloaded is None:
+            sheet, metrics, source = self._read()
+        else:
+            sheet, metrics, source = preloaded
+            source = f"preloaded, {source}"
 
-        for y in range(start_y, sheet.get_height()):
-            if y == sheet.get_height() - 1 or sheet.get_at((1, y)) == self.separator_color:
-                layer_positions.append((y - size, size))
-                size = 0
-                layer_n += 1
-            else:
-                size += 1
+        sheet = sheet.convert_alpha()
 
-        size = 0
-        letter = 0
+        layer_positions = [tuple(i) for i in metrics["layers"]]
 
         self.layers = list(abs(i) for i in self.raw_layers)
         layer_count = len(self.layers)
@@ -72,49 +130,37 @@ class VariantData:
             zip(range(layer_count), self.raw_layers, layer_targets, layer_positions)
         )
 
-        # Determine whether the author included a separator at x = 0 or not
-        start_x = int(sheet.get_at((0, 1)) == self.separator_color)
-
         # Read the unknown character
-        for x in range(start_x, sheet.get_width()):
-            if sheet.get_at((x, 1)) == self.separator_color:
-                self.surfaces["unknown"] = [None] * layer_count
-                self.surfaces["unknown"][0] = sheet.subsurface(
-                    (x - size, 0, size, layer_positions[0][1])
-                )
-                self.character_sizes["unknown"] = (x-size, size)
-                break
+        if metrics["unknown"] is not None:
+            x, size = metrics["unknown"]
+            self.surfaces["unknown"] = [None] * layer_count
+            self.surfaces["unknown"][0] = sheet.subsurface(
+                (x, 0, size, layer_positions[0][1])
+            )
+            self.character_sizes["unknown"] = (x, size)
 
         # Read the remaining characters
-        for x in range(x + 1, sheet.get_width()):
-            if sheet.get_at((x, 1)) == self.separator_color:
-                if letter >= len(self.characters):
-                    break
-
-                output = [None] * layer_count
-
-                for n, layer_type, target, (y, h) in layer_data:
-                    subsurf = sheet.subsurface((x - size, y, size, h))
-                    if layer_type >= 0:
-                        if output[target] is None:
-                            output[target] = subsurf
-                        else:
-                            output[target].blit(subsurf, (0, 0))
+        for letter, (x, size) in zip(self.characters, metrics["characters"]):
+            output = [None] * layer_count
+
+            for n, layer_type, target, (y, h) in layer_data:
+                subsurf = sheet.subsurface((x, y, size, h))
+                if layer_type >= 0:
+                    if output[target] is None:
+                        output[target] = subsurf
                     else:
-                        if output[target] is None:
-                            raise ValueError(
-                                "Cannot use subtraction on PixelFont layer because target layer does not yet exist"
-                            )
-                        output[target].blit(
-                            subsurf, (0, 0), special_flags=pygame.BLEND_RGBA_SUB
+                        output[target].blit(subsurf, (0, 0))
+                else:
+                    if output[target] is None:
+                        raise ValueError(
+                            "Cannot use subtraction on PixelFont layer because target layer does not yet exist"
                         )
+                    output[target].blit(
+                        subsurf, (0, 0), special_flags=pygame.BLEND_RGBA_SUB
+                    )
 
-                self.surfaces[self.characters[letter]] = output
-                self.character_sizes[self.characters[letter]] = (x - size, size)
-                size = 0
-                letter += 1
-            else:
-                size += 1
+            self.surfaces[letter] = output
+            self.character_sizes[letter] = (x, size)
 
         if " " in self.surfaces:
             self.surfaces["\n"] = self.surfaces[" "]
@@ -122,6 +168,96 @@ class VariantData:
             self.character_sizes["\n"] = self.character_sizes[" "]
             self.character_sizes["\r"] = self.character_sizes[" "]
 
-        log.font.info(f"Loaded variant '{self.path.name}' in {time.time() - start_time:2f}s.")
+        self._build_atlases()
+
+        log.font.info(
+            f"Loaded variant '{self.path.name}' ({source} metrics) in {time.time() - start_time:2f}s."
+        )
+
+    def _find_separators(self, strip: pygame.Surface) -> list[int]:
+        """
+        Returns the index of every pixel in a one pixel wide or tall surface that is the
+        separator color. The pixels are compared as bytes rather than read one at a time.
+        """
+        data = pygame.image.tobytes(strip, "RGBA")
+        target = bytes(self.separator_color)
+        found = []
+        i = data.find(target)
+        while i != -1:
+            if i % 4:
+                # The match straddles two pixels
+                i = data.find(target, i + 1)
+                continue
+            found.append(i // 4)
+            i = data.find(target, i + 4)
+        return found
+
+    def _scan(self, sheet: pygame.Surface) -> dict:
+        """
+        Find the position of each layer and character in the sheet from the separator pixels in
+        the column at x = 1 and the row at y = 1.
+        """
+        width, height = sheet.get_size()
+
+        rows = self._find_separators(sheet.subsurface((1, 0, 1, height)))
+        # Determine whether the author included a separator at y = 0 or not
+        start_y = int(bool(rows) and rows[0] == 0)
+
+        layer_positions = []
+        boundaries = [y for y in rows if y >= start_y]
+        if not boundaries or boundaries[-1] != height - 1:
+            boundaries.append(height - 1)
+        previous = start_y - 1
+        for y in boundaries:
+            size = y - previous - 1
+            layer_positions.append((y - size, size))
+            previous = y
+
+        columns = self._find_separators(sheet.subsurface((0, 1, width, 1)))
+        # Determine whether the author included a separator at x = 0 or not
+        start_x = int(bool(columns) and columns[0] == 0)
+        columns = [x for x in columns if x >= start_x]
+
+        # The unknown character is always read with a width of 0
+        unknown = (columns[0], 0) if columns else None
+
+        characters = []
+        for previous, x in zip(columns, columns[1:]):
+            size = x - previous - 1
+            characters.append((x - size, size))
+
+        return {"layers": layer_positions, "unknown": unknown, "characters": characters}
+
+    def _build_atlases(self) -> None:
+        """
+        Copy the glyphs into one surface per layer, so that a line of text can be rendered with
+        a single Surface.blits call for each layer.
+        """
+        layer_count = len(self.layers)
+        heights = [1] * layer_count
+        for glyph_layers in self.surfaces.values():
+            for n, glyph in enumerate(glyph_layers):
+                if glyph is not None:
+                    heights[n] = max(heights[n], glyph.get_height())
+
+        # Characters such as '\n' share their glyphs with another character
+        unique = {id(glyph_layers): name for name, glyph_layers in self.surfaces.items()}
+        width = sum(self.character_sizes[name][1] for name in unique.values())
+
+        self.atlases = [
+            pygame.Surface((max(1, width), height), pygame.SRCALPHA) for height in heights
+        ]
+        self.glyphs = {}
 
+        x = 0
+        for name in unique.values():
+            size = self.character_sizes[name][1]
+            for atlas, glyph in zip(self.atlases, self.surfaces[name]):
+                if glyph is not None:
+                    # The atlases are transparent, so this copies the glyph exactly
+                    atlas.blit(glyph, (x, 0), special_flags=pygame.BLEND_RGBA_MAX)
+            self.glyphs[name] = (pygame.Rect(x, 0, size, max(heights)), size)
+            x += size
 
+        for name, glyph_layers in self.surfaces.items():
+            self.glyphs[name] = self.glyphs[unique[id(glyph_layers)]]
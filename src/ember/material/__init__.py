@@ -1,4 +1,6 @@
 from .material import Material, MaterialWithElementCache, MaterialWithSizeCache
+from .surface_cache import MaterialSurfaceCache, material_surface_cache
+from .stats import MaterialStats, MaterialCounters, material_stats
 
 from .blank import Blank
 from .color import Color
@@ -1,4 +1,5 @@
 import pygame
+import math
 import warnings
 from .material import MaterialWithElementCache
 from typing import Optional, Literal, Any, TYPE_CHECKING
@@ -7,7 +8,7 @@ if TYPE_CHECKING:
     from ember.ui.base.element import Element
 
 from .. import common as _c
-from ..common import BlurMode, BLUR_PIL, BLUR_PYGAME
+from ..common import BlurMode, BLUR_PIL, BLUR_PYGAME, BLUR_BOX, BLUR_KAWASE
 
 try:
     from PIL import Image, ImageFilter
@@ -16,22 +17,64 @@ try:
 except ModuleNotFoundError:
     pillow_installed = False
 
+# The maximum size, along each axis, that the area behind the material is scaled down to in
+# order to detect whether it has changed
+CHANGE_DETECTION_SAMPLES = 128
+
 
 class Blur(MaterialWithElementCache):
     """
     Applies a gaussian blur to the material's area. Experimental.
+
+    The :code:`BLUR_BOX` and :code:`BLUR_KAWASE` methods scale the area down by
+    :code:`downsample`, blur it at that resolution and scale it back up. They are much faster
+    than the other methods for large areas, and are intended for areas that are blurred every
+    tick. :code:`BLUR_BOX` uses a box blur, and :code:`BLUR_KAWASE` uses dual Kawase passes,
+    which only need functions that every version of pygame-ce supports. Both methods are
+    intended for opaque backgrounds.
+
+    When :code:`recalculate_each_tick` is True, the blur is only recalculated if the pixels
+    behind the material have changed, and at most :code:`max_rate` times per second. Changes are
+    detected by comparing a scaled down copy of the area, in which each pixel is the average of
+    a block of pixels, so a change that is too faint to alter the average of its block is
+    missed.
     """
 
+    DEPENDS_ON_BACKGROUND = True
+
     def __init__(
         self,
         radius: int = 7,
         method: Optional[BlurMode] = BLUR_PYGAME,
         recalculate_each_tick: bool = False,
         alpha: int = 255,
+        downsample: int = 4,
+        detect_changes: bool = True,
+        max_rate: Optional[float] = None,
     ):
         self.radius = radius
         self.recalculate_each_tick = recalculate_each_tick
 
+        self.detect_changes: bool = detect_changes
+        """
+        If True, the blur is only recalculated each tick if the pixels behind the material have
+        changed. The area is scaled down to at most 128x128 pixels to compare it, so very faint
+        changes can be missed. Only used when :code:`recalculate_each_tick` is True.
+        """
+
+        self.max_rate: Optional[float] = max_rate
+        """
+        The maximum number of times per second that the blur is recalculated, or None for no
+        limit. Only used when :code:`recalculate_each_tick` is True.
+        """
+
+        self.downsample: int = downsample
+        """
+        The factor that the area is scaled down by before it is blurred, when the method is
+        :code:`BLUR_BOX` or :code:`BLUR_KAWASE`. Values from 2 to 8 work best. Higher values are
+        faster, but small details flicker more as the background moves.
+        """
+
         ver = pygame.version.vernum
         if ver < (2, 2):
             msg = (
@@ -40,13 +83,18 @@ class Blur(MaterialWithElementCache):
                 "upgrade pygame-ce to version 2.2.0 or later using 'pip install pygame-ce --upgrade'."
             )
 
-            if pillow_installed:
+            if method is BLUR_BOX:
+                warnings.warn(
+                    f"{msg} In the meantime, Kawase blur will be used instead."
+                )
+                method = BLUR_KAWASE
+            elif pillow_installed:
                 if method is BLUR_PYGAME:
                     warnings.warn(
                         f"{msg} In the meantime, PIL blur will be used instead."
                     )
                     method = BLUR_PIL
-            else:
+            elif method is not BLUR_KAWASE:
                 warnings.warn(
                     f"{msg} In the meantime, parts of the UI that "
                     f"should have been blurred will not be blurred."
@@ -69,11 +117,47 @@ class Blur(MaterialWithElementCache):
         if self.method is None:
             return False
 
+        if element not in self._cache or (pos, size) != self._cache[element][1]:
+            return True
+        if not self.recalculate_each_tick:
+            return False
+
+        _, _, source_hash, rendered_at = self._cache[element]
+        if (
+            self.max_rate is not None
+            and pygame.time.get_ticks() - rendered_at < 1000 / self.max_rate
+        ):
+            return False
         return (
-            self.recalculate_each_tick
-            or element not in self._cache
-            or (pos, size) != self._cache[element][1]
+            not self.detect_changes
+            or self._hash_source(self._get_source(surface, pos, size)) != source_hash
+        )
+
+    @staticmethod
+    def _get_source(
+        surface: pygame.Surface, pos: tuple[float, float], size: tuple[float, float]
+    ) -> pygame.Surface:
+        """
+        Returns the area of the surface behind the material.
+        """
+        if pos[1] + size[1] > surface.get_height():
+            size = size[0], surface.get_height() - pos[1]
+        return surface.subsurface(pos, size)
+
+    @staticmethod
+    def _hash_source(source: pygame.Surface) -> int:
+        """
+        Returns a hash of the surface scaled down, so that every pixel of the surface affects
+        the hash.
+        """
+        samples = pygame.transform.smoothscale(
+            source,
+            (
+                min(source.get_width(), CHANGE_DETECTION_SAMPLES),
+                min(source.get_height(), CHANGE_DETECTION_SAMPLES),
+            ),
         )
+        return hash(pygame.image.tobytes(samples, "RGBA"))
 
     def _render_surface(
         self,
@@ -83,9 +167,7 @@ class Blur(MaterialWithElementCache):
         size: tuple[float, float],
     ) -> Any:
 
-        if pos[1] + size[1] > surface.get_height():
-            size = size[0], surface.get_height() - pos[1]
-        new = surface.subsurface(pos, size)
+        new = self._get_source(surface, pos, size)
 
         if self.method is BLUR_PIL:
             img = Image.frombytes(
@@ -96,11 +178,93 @@ class Blur(MaterialWithElementCache):
                 img.tobytes(), img.size, "RGBA"
             )
 
+        elif self.method is BLUR_BOX or self.method is BLUR_KAWASE:
+            blurred_surface = self._downsampled_blur(new)
+
         else:
             radius = self.radius * 2
             blurred_surface = pygame.transform.gaussian_blur(new, radius)
 
-        return (blurred_surface, (pos, size))
+        source_hash = (
+            self._hash_source(new)
+            if self.recalculate_each_tick and self.detect_changes
+            else None
+        )
+        return blurred_surface, (pos, size), source_hash, pygame.time.get_ticks()
+
+    def _downsampled_blur(self, surface: pygame.Surface) -> pygame.Surface:
+        """
+        Scale the surface down by the downsample factor, blur it, and scale it back up. The
+        surface is halved repeatedly on the way down and doubled on the way up, so that each
+        step averages neighbouring pixels rather than skipping them.
+        """
+        size = surface.get_size()
+        factor = max(1, self.downsample)
+        small_size = (
+            max(1, math.ceil(size[0] / factor)),
+            max(1, math.ceil(size[1] / factor)),
+        )
+
+        sizes = [size]
+        while sizes[-1][0] > small_size[0] * 2 and sizes[-1][1] > small_size[1] * 2:
+            sizes.append((sizes[-1][0] // 2, sizes[-1][1] // 2))
+        if sizes[-1] != small_size:
+            sizes.append(small_size)
+
+        small = surface
+        for step_size in sizes[1:]:
+            small = pygame.transform.smoothscale(small, step_size)
+        if small is surface:
+            small = surface.copy()
+
+        # The blur at the small size has the spread, in full-size pixels, that the gaussian
+        # blur has for the same radius
+        spread = 1.75 * self.radius / factor
+        if self.method is BLUR_BOX:
+            small = pygame.transform.box_blur(small, max(1, round(spread * 5 / 3)))
+        else:
+            # Each pass averages the pixels at a diagonal offset, adding offset squared to
+            # the variance of the blur. The offset increases by one each pass, except for the
+            # last pass, which adds the variance that is left.
+            variance = offset = 0
+            while not offset or spread**2 - variance >= 0.25:
+                offset = max(1, min(offset + 1, round(math.sqrt(spread**2 - variance))))
+                variance += offset**2
+                small = self._kawase_pass(small, offset)
+
+        for step_size in reversed(sizes[:-1]):
+            small = pygame.transform.smoothscale(small, step_size)
+        return small
+
+    @staticmethod
+    def _kawase_pass(surface: pygame.Surface, offset: int) -> pygame.Surface:
+        """
+        Returns a surface where each pixel is the average of the four pixels of the given
+        surface at a diagonal offset from it.
+        """
+        # Each channel, including alpha, is divided by four and the samples are added, so that
+        # translucent surfaces keep their alpha. Multiplying rounds up, so two is subtracted
+        # first to round to the nearest value instead.
+        quarter = surface.copy()
+        quarter.fill((2, 2, 2, 2), special_flags=pygame.BLEND_RGBA_SUB)
+        quarter.fill((64, 64, 64, 64), special_flags=pygame.BLEND_RGBA_MULT)
+
+        result = None
+        for sample_pos in (
+            (offset, offset),
+            (offset, -offset),
+            (-offset, -offset),
+            (-offset, offset),
+        ):
+            # Pixels with no sample in the surface keep their own value
+            sample = quarter.copy()
+            sample.fill((0, 0, 0, 0), pygame.Rect(sample_pos, surface.get_size()))
+            sample.blit(quarter, sample_pos, special_flags=pygame.BLEND_RGBA_ADD)
+            if result is None:
+                result = sample
+            else:
+                result.blit(sample, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+        return result
 
     def get(self, element: "Element") -> Optional[pygame.Surface]:
         return self._cache[element][0]
@@ -1,4 +1,5 @@
 import pygame
+from collections.abc import Hashable
 from typing import Optional, Any, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -34,21 +35,9 @@ class Color(MaterialWithSizeCache):
     def __repr__(self) -> str:
         return f"<Color({self._color})>"
 
-    def _needs_to_render(
-        self,
-        element: "Element",
-        surface: pygame.Surface,
-        pos: tuple[float, float],
-        size: tuple[float, float],
-    ) -> bool:
-        if element not in self._cache:
-            return True
-        if 0 in self._cache[element].get_size():
-            return True
-        return (
-            self._cache[element].get_size() != size
-            or self._cache[element].get_at((0, 0))[:3] != self._color[:-1]
-        )
+    def _get_cache_key(self, size: tuple[float, float]) -> Hashable:
+        # Colors with the same parameters render the same surface, so they share it
+        return type(self), tuple(self._color), self.outline, tuple(size)
 
     def _render_surface(
         self,
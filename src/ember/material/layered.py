@@ -18,6 +18,10 @@ class Layered(Material):
         self.materials: Sequence[Material] = materials
         super().__init__(alpha)
 
+    @property
+    def DEPENDS_ON_BACKGROUND(self) -> bool:
+        return any(i.DEPENDS_ON_BACKGROUND for i in self.materials)
+
     def render(
         self,
         element: "Element",
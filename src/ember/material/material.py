@@ -1,6 +1,7 @@
 import pygame
 import abc
-from weakref import WeakKeyDictionary, WeakValueDictionary
+from collections.abc import Hashable
+from weakref import WeakKeyDictionary
 
 from typing import TYPE_CHECKING, Optional, Any
 
@@ -8,6 +9,8 @@ if TYPE_CHECKING:
     from ember.ui.base.element import Element
 
 from .. import log
+from .surface_cache import material_surface_cache
+from .stats import material_stats
 
 
 class Material(abc.ABC):
@@ -15,6 +18,7 @@ class Material(abc.ABC):
     All materials inherit from this class. This base class should not be instantiated.
     """
     UPDATES_EVERY_TICK = False
+    DEPENDS_ON_BACKGROUND = False
 
     def __init__(self, alpha: int):
         self.alpha: int = alpha
@@ -101,9 +105,12 @@ class MaterialWithElementCache(Material):
         Render the material to a surface, which is saved in a cache.
         Returns True if the Surface needed to be re-rendered.
         """
-        if self._needs_to_render(element, surface, pos, size):
+        rendered = self._needs_to_render(element, surface, pos, size)
+        material_stats.record(self, hit=not rendered)
+        if rendered:
             log.material.info("Rendering...", element, self)
             self._cache[element] = self._render_surface(element, surface, pos, size)
+            material_stats.record_render(self)
 
         new_surface = self.get(element)
         new_surface.set_alpha(alpha * self.alpha / 255)
@@ -113,24 +120,71 @@ class MaterialWithElementCache(Material):
 
 class MaterialWithSizeCache(MaterialWithElementCache, abc.ABC):
     """
-    Materials that have a size cache in addition to an element cache inherit from this class.
+    Materials whose surfaces only depend on their size inherit from this class. The surfaces
+    are stored in the global :py:class:`MaterialSurfaceCache<ember.material.MaterialSurfaceCache>`,
+    so every element that uses the material at the same size shares one surface.
     This base class should not be instantiated.
     """
 
     def __init__(self, alpha: int) -> None:
         super().__init__(alpha)
-
-        self._size_cache_k: WeakKeyDictionary[
-            Element, tuple[float, float]
+        # Incremented when the material is changed, so that the surfaces rendered before the
+        # change are no longer found in the surface cache
+        self._cache_version: int = 0
+        # The key and size of the surface last rendered for each element. Only the keys are
+        # kept, so that the surface cache alone decides how long the surfaces live.
+        self._keys: WeakKeyDictionary[
+            "Element", tuple[Hashable, tuple[float, float]]
         ] = WeakKeyDictionary()
-        self._size_cache_v: WeakValueDictionary[
-            tuple[float, float], Element
-        ] = WeakValueDictionary()
+        # The last surface returned, so that it can be retrieved with get() straight after it
+        # was rendered, even if it is too large to be kept in the surface cache
+        self._last_surface: Optional[tuple[Hashable, pygame.Surface]] = None
 
     def clear_cache(self) -> None:
         self._cache.clear()
-        self._size_cache_v.clear()
-        self._size_cache_k.clear()
+        self._keys.clear()
+        self._last_surface = None
+        self._cache_version += 1
+
+    def _get_cache_key(self, size: tuple[float, float]) -> Optional[Hashable]:
+        """
+        Returns the key that the surface of the given size is stored with in the surface cache.
+        None is returned if the surface can't be shared between elements, in which case it is
+        only stored in the element cache.
+        """
+        return self, self._cache_version, tuple(size)
+
+    def _get_shared_surface(
+        self,
+        key: Hashable,
+        element: Optional["Element"],
+        surface: Optional[pygame.Surface],
+        pos: tuple[float, float],
+        size: tuple[float, float],
+    ) -> tuple[pygame.Surface, bool]:
+        """
+        Returns the surface stored in the surface cache with the key, rendering it if it isn't
+        there, and whether it was rendered.
+        """
+        if self._last_surface is not None and self._last_surface[0] == key:
+            return self._last_surface[1], False
+        if (material_surface := material_surface_cache.get(key)) is not None:
+            rendered = False
+        else:
+            log.material.info("Rendering...", element, self)
+            material_surface = self._render_surface(element, surface, pos, size)
+            material_surface_cache.add(key, material_surface)
+            material_stats.record_render(self)
+            rendered = True
+        self._last_surface = key, material_surface
+        return material_surface, rendered
+
+    def get(self, element: "Element") -> Optional[pygame.Surface]:
+        if (entry := self._keys.get(element)) is None:
+            return super().get(element)
+        key, size = entry
+        # If the surface was removed from the surface cache, it is rendered again
+        return self._get_shared_surface(key, element, None, (0, 0), size)[0]
 
     def render(
         self,
@@ -140,35 +194,21 @@ class MaterialWithSizeCache(MaterialWithElementCache, abc.ABC):
         size: tuple[int, int],
         alpha: int,
     ) -> Optional[pygame.Surface]:
-        if self._needs_to_render(element, surface, pos, size):
-            if size in self._size_cache_v:
-                log.material.info(f"Reusing size {size}...", element, self)
-                if self.get(self._size_cache_v[size]).get_size() != size:
-                    log.material.info("Rendering...", element, self)
-                    self._cache[element] = self._render_surface(
-                        element, surface, pos, size
-                    )
-
-                    other_element = self._size_cache_v[size]
-                    if other_element in self._size_cache_k:
-                        del self._size_cache_v[self._size_cache_k[other_element]]
-                        del self._size_cache_k[other_element]
-
-                    self._size_cache_v[size] = element
-                    self._size_cache_k[element] = size
-                else:
-                    self._cache[element] = self._cache[self._size_cache_v[size]]
-
-            else:
-                log.material.info("Rendering...", element, self)
-                self._cache[element] = self._render_surface(element, surface, pos, size)
-                if element in self._size_cache_k:
-                    del self._size_cache_v[self._size_cache_k[element]]
-
-                self._size_cache_v[size] = element
-                self._size_cache_k[element] = size
-
-        material_surface = self._cache[element]
-        material_surface.set_alpha(alpha * self.alpha / 255)
+        if (key := self._get_cache_key(size)) is None:
+            self._keys.pop(element, None)
+            return super().render(element, surface, pos, size, alpha)
+
+        material_surface, rendered = self._get_shared_surface(
+            key, element, surface, pos, size
+        )
+        material_stats.record(self, hit=not rendered)
+
+        self._cache.pop(element, None)
+        self._keys[element] = key, tuple(size)
+        if (alpha := alpha * self.alpha / 255) >= 255:
+            return material_surface
+        # The surface is shared, so the alpha is set on a subsurface that shares its pixels
+        # rather than on the surface itself
+        material_surface = material_surface.subsurface(material_surface.get_rect())
+        material_surface.set_alpha(alpha)
         return material_surface
-    
\ No newline at end of file
@@ -1,4 +1,5 @@
 import pygame
+from collections.abc import Hashable
 import math
 from typing import Union, Optional, Any, TYPE_CHECKING
 
@@ -34,14 +35,9 @@ class RepeatedSurface(MaterialWithSizeCache):
     def __repr__(self) -> str:
         return "<StretchedSurface>"
 
-    def _needs_to_render(
-        self,
-        element: "Element",
-        surface: pygame.Surface,
-        pos: tuple[float, float],
-        size: tuple[float, float],
-    ) -> bool:
-        return element not in self._cache or self._cache[element].get_size() != size
+    def _get_cache_key(self, size: tuple[float, float]) -> Hashable:
+        # Materials that repeat the same surface in the same way share the repeated surface
+        return type(self), self._surface, self._content_x, self._content_y, tuple(size)
 
     def _render_surface(
         self,
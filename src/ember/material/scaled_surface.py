@@ -1,4 +1,5 @@
 import pygame
+from collections.abc import Hashable
 from typing import Union, Sequence, Optional, Any, TYPE_CHECKING
 
 from .material import MaterialWithSizeCache
@@ -33,14 +34,9 @@ class ScaledSurface(MaterialWithSizeCache):
     def __repr__(self) -> str:
         return "<StretchedSurface>"
 
-    def _needs_to_render(
-        self,
-        element: "Element",
-        surface: pygame.Surface,
-        pos: tuple[float, float],
-        size: tuple[float, float],
-    ) -> bool:
-        return element not in self._cache or self._cache[element].get_size() != size
+    def _get_cache_key(self, size: tuple[float, float]) -> Hashable:
+        # Materials that scale the same surface in the same way share the scaled surface
+        return type(self), self._surface, self.smooth, tuple(size)
 
     def _render_surface(
         self,
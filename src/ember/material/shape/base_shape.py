@@ -1,16 +1,17 @@
 import pygame
 import abc
+from collections.abc import Hashable
 from typing import Optional, TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from ember.ui.base.element import Element
 
-from ..material import MaterialWithElementCache, Material
+from ..material import MaterialWithSizeCache, Material
 
 from ...common import ColorType
 
 
-class Shape(MaterialWithElementCache, abc.ABC):
+class Shape(MaterialWithSizeCache, abc.ABC):
     """
     All shape materials inherit from this class. This base class should not be instantiated.
     """
@@ -34,6 +35,10 @@ class Shape(MaterialWithElementCache, abc.ABC):
         self._material: Optional[Material] = material
         self._color: Optional[ColorType] = color
 
+    @property
+    def DEPENDS_ON_BACKGROUND(self) -> bool:
+        return self._material is not None and self._material.DEPENDS_ON_BACKGROUND
+
     @abc.abstractmethod
     def _create_surface(self, size: tuple[float, float]) -> pygame.Surface:
         pass
@@ -41,6 +46,16 @@ class Shape(MaterialWithElementCache, abc.ABC):
     def _update_generic_surface(self):
         self.clear_cache()
 
+    def _get_cache_key(self, size: tuple[float, float]) -> Optional[Hashable]:
+        if self._material is None:
+            return super()._get_cache_key(size)
+        # The shape can only be shared if the material inside it can be
+        if isinstance(self._material, MaterialWithSizeCache) and (
+            key := self._material._get_cache_key(size)
+        ) is not None:
+            return self, self._cache_version, key
+        return None
+
     def _needs_to_render(
         self,
         element: "Element",
@@ -0,0 +1,181 @@
+import pygame
+from dataclasses import dataclass, asdict
+from weakref import WeakKeyDictionary
+from typing import TYPE_CHECKING, Any
+
+from .surface_cache import material_surface_cache
+
+if TYPE_CHECKING:
+    from .material import Material, MaterialWithElementCache
+
+COUNTERS = ("render_calls", "renders", "hits", "misses")
+
+
+@dataclass
+class MaterialCounters:
+    """
+    The number of times a material, or the materials of a class, did something.
+    """
+
+    render_calls: int = 0
+    """
+    The number of times :code:`render` was called.
+    """
+    renders: int = 0
+    """
+    The number of times a surface was rendered with :code:`_render_surface`. This includes
+    surfaces rendered again by :code:`get` after they were removed from the surface cache, so
+    it can be higher than :code:`misses`.
+    """
+    hits: int = 0
+    """
+    The number of render calls that reused a cached surface.
+    """
+    misses: int = 0
+    """
+    The number of render calls that found no usable surface in the cache.
+    """
+
+
+class MaterialStats:
+    """
+    Counts the render calls of the materials that have a cache, for each material and for each
+    material class. Use this to find materials that render a new surface every tick.
+
+    Counting is disabled by default. Set :code:`enabled` to True to start counting.
+    """
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        """
+        If False, render calls aren't counted.
+        """
+
+        self._instances: WeakKeyDictionary["Material", MaterialCounters] = (
+            WeakKeyDictionary()
+        )
+        self._classes: dict[type, MaterialCounters] = {}
+
+    def __repr__(self) -> str:
+        return f"<MaterialStats({len(self._instances)} materials)>"
+
+    def record(self, material: "Material", hit: bool) -> None:
+        """
+        Used internally by the library. Counts a render call of the material, which found a
+        usable surface in the cache if :code:`hit` is True.
+        """
+        if not self.enabled:
+            return
+        for counters in self._get_counters(material):
+            counters.render_calls += 1
+            if hit:
+                counters.hits += 1
+            else:
+                counters.misses += 1
+
+    def record_render(self, material: "Material") -> None:
+        """
+        Used internally by the library. Counts a surface rendered by the material, either for
+        a render call that missed the cache or to replace a surface that was removed from it.
+        """
+        if not self.enabled:
+            return
+        for counters in self._get_counters(material):
+            counters.renders += 1
+
+    def _get_counters(
+        self, material: "Material"
+    ) -> tuple[MaterialCounters, MaterialCounters]:
+        if (instance := self._instances.get(material)) is None:
+            instance = self._instances[material] = MaterialCounters()
+        if (cls := self._classes.get(type(material))) is None:
+            cls = self._classes[type(material)] = MaterialCounters()
+        return instance, cls
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Returns the counters of every material and material class that has been counted since
+        the last reset, and the number of bytes of surfaces each of them currently uses from its
+        element cache or the surface cache. A surface shared between elements is only counted
+        once per material. The result has this structure:
+
+        .. code-block:: python
+
+            {
+                "instances": {material: {"render_calls": 0, ..., "bytes": 0}},
+                "classes": {Color: {"render_calls": 0, ..., "bytes": 0}},
+                "surface_cache_bytes": 0,
+            }
+        """
+        instances = {}
+        class_bytes = {}
+        for material, counters in list(self._instances.items()):
+            size = self._get_bytes(material)
+            instances[material] = {**asdict(counters), "bytes": size}
+            class_bytes[type(material)] = class_bytes.get(type(material), 0) + size
+
+        return {
+            "instances": instances,
+            "classes": {
+                cls: {**asdict(counters), "bytes": class_bytes.get(cls, 0)}
+                for cls, counters in self._classes.items()
+            },
+            "surface_cache_bytes": material_surface_cache.bytes,
+        }
+
+    def report(self, count: int = 10, sort_by: str = "renders") -> str:
+        """
+        Returns a table of the :code:`count` materials with the highest value of the
+        :code:`sort_by` counter, and a total for each material class.
+        """
+        snapshot = self.snapshot()
+        header = f"{'':<40}" + "".join(f"{i:>13}" for i in COUNTERS + ("bytes",))
+
+        def row(name: str, values: dict[str, int]) -> str:
+            return f"{name[:40]:<40}" + "".join(
+                f"{values[i]:>13}" for i in COUNTERS + ("bytes",)
+            )
+
+        lines = [header]
+        for material, values in sorted(
+            snapshot["instances"].items(), key=lambda i: -i[1][sort_by]
+        )[:count]:
+            lines.append(row(repr(material), values))
+        lines.append("")
+        for cls, values in sorted(
+            snapshot["classes"].items(), key=lambda i: -i[1][sort_by]
+        ):
+            lines.append(row(cls.__name__, values))
+        lines.append(f"Surface cache: {snapshot['surface_cache_bytes']} bytes")
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """
+        Set every counter to zero.
+        """
+        self._instances.clear()
+        self._classes.clear()
+
+    @staticmethod
+    def _get_bytes(material: "MaterialWithElementCache") -> int:
+        surfaces = {}
+        for value in list(material._cache.values()):
+            # Some materials cache a tuple containing the surface
+            surface = value[0] if isinstance(value, tuple) else value
+            if isinstance(surface, pygame.Surface):
+                surfaces[id(surface)] = surface
+        # Materials with a size cache only keep the keys of their surfaces in the surface cache
+        for key, _ in list(getattr(material, "_keys", {}).values()):
+            if (surface := material_surface_cache.peek(key)) is not None:
+                surfaces[id(surface)] = surface
+        if (last := getattr(material, "_last_surface", None)) is not None:
+            surfaces[id(last[1])] = last[1]
+        return sum(
+            i.get_width() * i.get_height() * i.get_bytesize() for i in surfaces.values()
+        )
+
+
+material_stats: MaterialStats = MaterialStats()
+"""
+The MaterialStats that every material with a cache reports its render calls to.
+"""
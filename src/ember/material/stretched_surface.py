@@ -1,4 +1,5 @@
 import pygame
+from collections.abc import Hashable
 from functools import partial
 from typing import Union, Sequence, Optional, Any, TYPE_CHECKING
 from os import PathLike, fspath
@@ -46,14 +47,11 @@ class StretchedSurface(MaterialWithSizeCache):
     def __repr__(self) -> str:
         return "<StretchedSurface>"
 
-    def _needs_to_render(
-        self,
-        element: "Element",
-        surface: pygame.Surface,
-        pos: tuple[float, float],
-        size: tuple[float, float],
-    ) -> bool:
-        return element not in self._cache or self._cache[element].get_size() != size
+    def _get_cache_key(self, size: tuple[float, float]) -> Optional[Hashable]:
+        if self.surface is None:
+            return None
+        # Materials that stretch the same surface with the same edges share the stretched surface
+        return type(self), self.surface, tuple(self._edge), tuple(size)
 
     def _render_surface(
         self,
@@ -0,0 +1,134 @@
+import pygame
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Optional, TYPE_CHECKING
+
+from .. import log
+
+if TYPE_CHECKING:
+    from .material import MaterialWithSizeCache
+
+
+class MaterialSurfaceCache:
+    """
+    A cache of the surfaces rendered by materials whose surfaces only depend on their size, such
+    as :py:class:`Color<ember.material.Color>` and the shape materials. Elements that use the
+    same material at the same size share one surface. When the total size of the cached surfaces
+    exceeds :code:`max_bytes`, the least recently used surfaces that aren't pinned are removed.
+
+    The surfaces returned by the cache are shared, and must not be modified.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self._max_bytes: int = max_bytes
+        self._entries: OrderedDict[Hashable, tuple[pygame.Surface, int]] = OrderedDict()
+        self._bytes: int = 0
+        # The number of times each material and size has been pinned
+        self._pins: dict[tuple["MaterialWithSizeCache", tuple[float, float]], int] = {}
+
+    def __repr__(self) -> str:
+        return f"<MaterialSurfaceCache({len(self._entries)} entries, {self._bytes} bytes)>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_bytes(self) -> int:
+        """
+        The maximum total size of the cached surfaces, in bytes. Pinned surfaces are counted,
+        but never removed. If the cache is larger than the new value, surfaces are removed.
+        """
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value: int) -> None:
+        self._max_bytes = value
+        self._trim()
+
+    @property
+    def bytes(self) -> int:
+        """
+        The total size of the cached surfaces, in bytes. Read-only.
+        """
+        return self._bytes
+
+    def get(self, key: Hashable) -> Optional[pygame.Surface]:
+        """
+        Returns the surface stored with the given key, or :code:`None` if there isn't one.
+        """
+        if (entry := self._entries.get(key)) is None:
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def peek(self, key: Hashable) -> Optional[pygame.Surface]:
+        """
+        Returns the surface stored with the given key, or :code:`None` if there isn't one,
+        without marking it as recently used.
+        """
+        if (entry := self._entries.get(key)) is None:
+            return None
+        return entry[0]
+
+    def add(self, key: Hashable, surface: pygame.Surface) -> None:
+        """
+        Store a surface with the given key, removing the least recently used surfaces if the
+        cache is now too large.
+        """
+        size = surface.get_width() * surface.get_height() * surface.get_bytesize()
+        if (old := self._entries.pop(key, None)) is not None:
+            self._bytes -= old[1]
+        self._entries[key] = (surface, size)
+        self._bytes += size
+        self._trim()
+
+    def pin(self, material: "MaterialWithSizeCache", size: tuple[float, float]) -> None:
+        """
+        Keep the surface of the material at the given size in the cache until :py:meth:`unpin`
+        is called, even if the cache is over budget. A material and size can be pinned more than
+        once, and must then be unpinned the same number of times. The surface is pinned even
+        if it is rendered after this is called, or the parameters of the material change.
+        """
+        key = (material, tuple(size))
+        self._pins[key] = self._pins.get(key, 0) + 1
+
+    def unpin(self, material: "MaterialWithSizeCache", size: tuple[float, float]) -> None:
+        """
+        Undo a call to :py:meth:`pin`.
+        """
+        key = (material, tuple(size))
+        if (count := self._pins.get(key, 0)) <= 1:
+            self._pins.pop(key, None)
+            self._trim()
+        else:
+            self._pins[key] = count - 1
+
+    def _trim(self) -> None:
+        if self._bytes <= self._max_bytes:
+            return
+
+        pinned = {
+            material._get_cache_key(size) for material, size in self._pins
+        }
+        for key in list(self._entries):
+            if self._bytes <= self._max_bytes:
+                break
+            if key in pinned:
+                continue
+            _, size = self._entries.pop(key)
+            self._bytes -= size
+
+    def clear(self) -> None:
+        """
+        Remove every surface from the cache, including pinned surfaces. The pins are kept.
+        """
+        log.material.info(f"Clearing material surface cache of {len(self._entries)} entries.")
+        self._entries.clear()
+        self._bytes = 0
+
+
+material_surface_cache: MaterialSurfaceCache = MaterialSurfaceCache()
+"""
+The MaterialSurfaceCache used by every material that inherits from
+:py:class:`MaterialWithSizeCache<ember.material.MaterialWithSizeCache>`.
+"""
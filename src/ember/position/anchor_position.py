@@ -19,9 +19,13 @@ class AnchorPosition(Position):
             return (
                 self.value == other.value
                 and self.percent == other.percent
+                and self.padding == other.padding
             )
         return False
 
+    def __hash__(self) -> int:
+        return hash((self.value, self.percent, self.padding))
+
     def __add__(self, other):
         if isinstance(other, (int, float)):
             return type(self)(self.value + other, self.percent)
@@ -3,6 +3,8 @@ from ember.ui import *
 from .container import Container
 from .stack import Stack, HStack, VStack
 from .text import Text
+from .text_log import TextLog
+from .material_stats_overlay import MaterialStatsOverlay
 from .icon import Icon
 from .button import Button
 from .toggle_button import ToggleButton
@@ -11,6 +13,6 @@ from .divider import Divider
 from .bar import Bar
 from .slider import Slider
 from .scrollbar import ScrollBar
-#from .scroll import Scroll
+from .scroll import Scroll
 
 background_color = (40, 40, 50)
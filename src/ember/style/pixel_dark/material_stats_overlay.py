@@ -0,0 +1,18 @@
+from ember.ui.material_stats_overlay import MaterialStatsOverlay as _MaterialStatsOverlay
+from ember.font.pixel_font import PixelFont
+from ember.material.color import Color
+
+from ember.common import package
+from ember._init import init_task
+
+class MaterialStatsOverlay(_MaterialStatsOverlay):
+    pass
+
+@init_task
+def _():
+    MaterialStatsOverlay.font.default_value = PixelFont(
+        path=package.joinpath(f"default_fonts/pixel")
+    )
+    MaterialStatsOverlay.primary_material.default_value = Color("white")
+
+del _
@@ -0,0 +1,18 @@
+from ember.ui.text_log import TextLog as _TextLog
+from ember.font.pixel_font import PixelFont
+from ember.material.color import Color
+
+from ember.common import package
+from ember._init import init_task
+
+class TextLog(_TextLog):
+    pass
+
+@init_task
+def _():
+    TextLog.font.default_value = PixelFont(
+        path=package.joinpath(f"default_fonts/pixel")
+    )
+    TextLog.primary_material.default_value = Color("white")
+
+del _
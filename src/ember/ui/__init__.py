@@ -17,6 +17,7 @@ from .stack import Stack
 from .h_stack import HStack
 from .v_stack import VStack
 from .z_stack import ZStack
+from .virtual_v_stack import VirtualVStack
 
 from .box import Box
 from .masked_container import MaskedBox
@@ -24,10 +25,12 @@ from .panel_container import PanelBox
 #from .resizable import Resizable
 # from .section import Section
 
-#from .scroll import Scroll
+from .scroll import Scroll
 #from .masked_container import MaskedContainer
 
 from .text import Text
+from .text_log import TextLog
+from .material_stats_overlay import MaterialStatsOverlay
 #from .icon import Icon
 from .spacer import Spacer
 from .panel import Panel
@@ -47,4 +50,4 @@ from .toggle_button import ToggleButton
 from .panel_toggle_button import PanelToggleButton
 from .switch import Switch
 
-#from .grid import Grid
+from .grid import Grid
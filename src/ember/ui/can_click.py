@@ -19,6 +19,17 @@ class CanClick(CanHover, Element):
         self._clicked: bool = False
         super().__init__(*args, **kwargs)
 
+    _event_types = frozenset(
+        {
+            pygame.MOUSEBUTTONDOWN,
+            pygame.MOUSEBUTTONUP,
+            pygame.KEYDOWN,
+            pygame.KEYUP,
+            pygame.JOYBUTTONDOWN,
+            pygame.JOYBUTTONUP,
+        }
+    )
+
     def _event(self, event: pygame.event.Event) -> bool:
         if super()._event(event):
             return True
@@ -32,6 +32,7 @@ class CanDisable(Element):
             event = pygame.event.Event(DISABLED if value else ENABLED, element=self)
             self._post_event(event)
             if self.parent is not None:
+                self.parent._child_geometry_modified(self)
                 self.parent.update_min_size()
             if self._disabled and self.layer is not None:
                 if self.layer.element_focused is self:
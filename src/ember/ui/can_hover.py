@@ -5,27 +5,45 @@ from typing import TYPE_CHECKING
 from ember.ui.element import Element
 from ember.event import HOVERED, UNHOVERED
 
-from ember import common as _c
-
 if TYPE_CHECKING:
     pass
 
 
 class CanHover(Element):
+    """
+    This class is a mixin, and should not be instantiated directly.
+    It provides functionality for detecting when the mouse is over the element. The hovered
+    state is set by the ViewLayer, which stores its hoverable elements in a spatial index.
+    """
+
     def __init__(self, *args, **kwargs) -> None:
         self._hovered: bool = False
         super().__init__(*args, **kwargs)
-       
 
-    def _update(self) -> None:
-        if self.rect.collidepoint(_c.mouse_pos) != self._hovered:
-            self._hovered = not self._hovered
+    def update_ancestry(self, ancestry: list["Element"]) -> None:
+        old_layer = self.layer
+        super().update_ancestry(ancestry)
+        if self.layer is not old_layer:
+            if old_layer is not None:
+                old_layer._remove_hoverable_element(self)
+            if self.layer is not None:
+                self.layer.hover_index.update(self, self.rect)
+
+    def _move_rect(self, x: float, y: float, w: float, h: float) -> None:
+        super()._move_rect(x, y, w, h)
+        if self.layer is not None:
+            self.layer.hover_index.update(self, self.rect)
+
+    def _set_hovered(self, hovered: bool) -> None:
+        """
+        Used internally by the library.
+        """
+        if hovered != self._hovered:
+            self._hovered = hovered
             if self._hovered:
                 self._post_event(HOVERED)
             else:
                 self._post_event(UNHOVERED)
-        return super()._update()
-    
 
     @property
     def hovered(self) -> bool:
@@ -23,6 +23,8 @@ class ClickActivateHybrid(CanHover, Element):
         self.activated = False
         self._post_event(DEACTIVATED)
         
+    _event_types = frozenset({pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN})
+
     def _event(self, event: pygame.event.Event) -> bool:
         if super()._event(event):
             return True
@@ -66,8 +66,48 @@ class Container(Element, ABC, metaclass=ContainerMeta):
             self,
             (cascading,) if isinstance(cascading, CascadingTraitValue) else cascading,
         )
+        self._subtree_event_types: Optional[frozenset[int]] = None
+        self._subtree_event_types_valid: bool = False
         super().__init__(*args, **kwargs)
 
+    def _get_subtree_event_types(self) -> Optional[frozenset[int]]:
+        if not self._subtree_event_types_valid:
+            event_types = self._handled_event_types
+            if event_types is not None:
+                event_types = set(event_types)
+                for element in self._child_elements:
+                    if element is None:
+                        continue
+                    if (child_event_types := element._get_subtree_event_types()) is None:
+                        event_types = None
+                        break
+                    event_types.update(child_event_types)
+            self._subtree_event_types = (
+                None if event_types is None else frozenset(event_types)
+            )
+            self._subtree_event_types_valid = True
+        return self._subtree_event_types
+
+    def _clear_subtree_event_types(self) -> None:
+        """
+        Called when an element is added to or removed from the container, so that the event
+        types handled by the container's subtree are recalculated.
+        """
+        for container in (self, *self.ancestry):
+            container._subtree_event_types_valid = False
+
+    def _child_geometry_modified(self, element: Element) -> None:
+        """
+        Called before the minimum size of the container is updated because the minimum size or
+        geometry traits of a child element were modified.
+        """
+
+    def _update_culled_child_rect(self, element: Element) -> None:
+        """
+        Called when the rect of a culled descendant is read. Containers that don't update the
+        rects of the children they cull override this to update the rect of the child.
+        """
+
     def _build(self) -> None:
         with Trait.inspecting(Trait.Layer.PARENT), log.size.indent():
             for element in self._child_elements:
@@ -143,6 +183,7 @@ class Container(Element, ABC, metaclass=ContainerMeta):
                 f"Tried to add a container ({self}) as a child element of itself, which isn't allowed."
             )
         yield element
+        self._clear_subtree_event_types()
 
         if self._has_built:
             if element is not None:
@@ -157,10 +198,15 @@ class Container(Element, ABC, metaclass=ContainerMeta):
         self, element: Optional["Element"], update: bool = True
     ) -> None:
         if element is not None:
+            for i in element.unpack():
+                if i is not None:
+                    i.mark_dirty()
+                    i._layout_changed()
             element.update_ancestry([])
             if self.layer is not None:
                 if self.layer.element_focused is element:
                     self.layer._focus_element(None)
+            self._clear_subtree_event_types()
         if self._has_built and update:
             self.update_min_size_next_tick()
             self.update_rect_next_tick()
@@ -24,7 +24,9 @@ def load_material(material: Union[Material, ColorType, None]) -> Material:
 
 class Divider(CanPivot, HasGeometry):
     material = Trait(
-        default_value=DEFAULT_BLACK_MATERIAL, load_value_with=load_material
+        default_value=DEFAULT_BLACK_MATERIAL,
+        on_update=lambda self: self.mark_dirty(),
+        load_value_with=load_material,
     )
 
     def __init__(
@@ -49,9 +51,17 @@ class Divider(CanPivot, HasGeometry):
     def _render(
         self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
     ) -> None:
-        rect = self.rect.move([-i for i in surface.get_abs_offset()])
+        abs_offset = surface.get_abs_offset()
+        rect = self.rect.move(offset[0] - abs_offset[0], offset[1] - abs_offset[1])
         if self.material is not None:
             self.material.draw(self, surface, rect.topleft, rect.size, alpha)
+            if self.material.UPDATES_EVERY_TICK:
+                self.mark_dirty()
+
+    def _can_render_to_cache(self) -> bool:
+        return self.material is None or not (
+            self.material.UPDATES_EVERY_TICK or self.material.DEPENDS_ON_BACKGROUND
+        )
 
     def update_ancestry(self, ancestry: list["Element"]) -> None:
         super().update_ancestry(ancestry)
@@ -51,6 +51,19 @@ class Element(abc.ABC, metaclass=ElementMeta):
 
     _traits: tuple[Trait] = ()
     _callback_registry: CallbackRegistry = CallbackRegistry()
+
+    _event_types: Optional[frozenset[int]] = None
+    """
+    The event types that the _event method defined in the same class body handles. A class that
+    overrides _event without declaring this could handle any event type.
+    """
+
+    _handled_event_types: Optional[frozenset[int]] = None
+    """
+    The event types handled by the element's class and its bases, or None if any event type might
+    be handled. Set by ElementMeta.
+    """
+
     _instances = WeakSet()
 
     # ----------------------------
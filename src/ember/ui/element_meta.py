@@ -17,6 +17,18 @@ class ElementMeta(abc.ABCMeta, type):
     def __init__(cls: Type["Element"], name, bases, attrs):
         super().__init__(name, bases, attrs)
 
+        # A class that overrides _event without declaring _event_types could handle any event
+        handled_event_types = set()
+        for klass in cls.__mro__:
+            if "_event" in vars(klass):
+                if (event_types := vars(klass).get("_event_types")) is None:
+                    handled_event_types = None
+                    break
+                handled_event_types.update(event_types)
+        cls._handled_event_types = (
+            None if handled_event_types is None else frozenset(handled_event_types)
+        )
+
         if on_event_queue or (
             len(bases) > 1
             and any(getattr(i, "_callback_registry", False) for i in bases)
@@ -23,8 +23,7 @@ class FocusPassthroughContainer(CanHandleFocusChildDependent, MultiElementContai
         super().__init__(*args, **kwargs)
 
     def update_can_focus(self) -> None:
-        if self in self.layer.can_focus_update_queue:
-            self.layer.can_focus_update_queue.remove(self)
+        self.layer.can_focus_update_queue.discard(self)
 
         if self._can_focus != any(i._can_focus for i in self._elements if i is not None):
             self._can_focus = not self._can_focus
@@ -40,6 +40,147 @@ class GeometricContainer(Container, HasGeometry, ABC):
     """
     Base class for Containers that have geometry.
     """
+
+    retain_render: bool = Trait(False, on_update=lambda self: self._clear_render_cache())
+    """
+    If True, the container draws its children to an offscreen surface once, and blits that surface
+    on subsequent frames until one of its descendants changes. This is useful for large containers
+    whose contents rarely change. The cache isn't used if any descendant can't be drawn offscreen,
+    such as an element with a Blur material, or if translucent descendants overlap, as the
+    cached surface would then blend differently with the background.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        self._render_cache: Optional[pygame.Surface] = None
+        self._render_cache_rect: pygame.Rect = pygame.Rect(0, 0, 0, 0)
+        self._render_cache_clip: Optional[pygame.Rect] = None
+        self._render_cache_checked: bool = False
+        # Whether the retained render surface blends with the background in the same way as the
+        # children drawn directly. None if it hasn't been checked since the layout last changed.
+        self._render_cache_exact: Optional[bool] = None
+        super().__init__(*args, **kwargs)
+
+    def _clear_render_cache(self) -> None:
+        """
+        Discards the retained render surface, so that it is regenerated on the next render.
+        """
+        self._render_cache = None
+        self._render_cache_clip = None
+        self._render_cache_checked = False
+
+    def render(
+        self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
+    ) -> None:
+        if not self.retain_render or alpha != 255:
+            super().render(surface, offset, alpha=alpha)
+            return
+
+        abs_offset = surface.get_abs_offset()
+        clip = pygame.Rect(abs_offset, surface.get_size())
+        if not self._render_cache_checked or clip != self._render_cache_clip:
+            self._generate_render_cache(clip)
+
+        if self._render_cache is None:
+            super().render(surface, offset, alpha=alpha)
+            return
+
+        surface.blit(
+            self._render_cache,
+            (
+                self._render_cache_rect.x + offset[0] - abs_offset[0],
+                self._render_cache_rect.y + offset[1] - abs_offset[1],
+            ),
+        )
+
+    def _generate_render_cache(self, clip: pygame.Rect) -> None:
+        """
+        Draws the children of the container to the retained render surface. Only the area of the
+        container's children that is within the :code:`clip` rect is drawn.
+        """
+        self._render_cache = None
+        self._render_cache_clip = clip
+        self._render_cache_checked = True
+        if not self._can_render_to_cache():
+            log.size.info("Container can't be drawn offscreen, not retaining render.", self)
+            return
+        if self._render_cache_exact is False:
+            log.size.info("Retained render surface isn't exact, not retaining render.", self)
+            return
+
+        bounds = self._get_render_bounds().clip(clip)
+        cache = pygame.Surface(bounds.size, pygame.SRCALPHA)
+        self._render(cache, (-bounds.x, -bounds.y), 255)
+
+        # Only checked when the layout changes, as it draws the children twice more
+        if self._render_cache_exact is None:
+            self._render_cache_exact = self._is_render_cache_exact(cache, bounds)
+            if not self._render_cache_exact:
+                log.size.info(
+                    "Retained render surface differs from direct render, not retaining render.",
+                    self,
+                )
+                return
+
+        # A descendant might have cleared the cache while it was being drawn
+        if self._render_cache_checked:
+            self._render_cache = cache
+            self._render_cache_rect = bounds
+            log.size.info(f"Retained render surface with rect {bounds}.", self)
+
+    def _is_render_cache_exact(self, cache: pygame.Surface, bounds: pygame.Rect) -> bool:
+        """
+        Returns False if blitting the retained render surface gives a different result to
+        drawing the children directly. This happens when translucent descendants overlap, as
+        blending onto a translucent pixel doesn't give the same color as blending onto the
+        opaque pixels behind it. Both are drawn over black and over white, the two extremes of
+        each channel.
+        """
+        for background in ((0, 0, 0), (255, 255, 255)):
+            direct = pygame.Surface(bounds.size)
+            direct.fill(background)
+            self._render(direct, (-bounds.x, -bounds.y), 255)
+            cached = pygame.Surface(bounds.size)
+            cached.fill(background)
+            cached.blit(cache, (0, 0))
+
+            difference = direct.copy()
+            difference.blit(cached, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+            cached.blit(direct, (0, 0), special_flags=pygame.BLEND_RGB_SUB)
+            difference.blit(cached, (0, 0), special_flags=pygame.BLEND_RGB_ADD)
+            # Blending rounds differently in the two cases, so small differences are allowed
+            matching = pygame.mask.from_threshold(difference, (0, 0, 0), (4, 4, 4, 255))
+            if matching.count() != bounds.w * bounds.h:
+                return False
+        return True
+
+    def _get_render_bounds(self) -> pygame.Rect:
+        bounds = self._get_covered_rect()
+        for element in self._elements_to_render:
+            if element is not None:
+                bounds.union_ip(element._get_render_bounds())
+        return bounds
+
+    def _set_visible(self, visible: bool) -> None:
+        super()._set_visible(visible)
+        for element in self._visible_child_elements if visible else self._child_elements:
+            if element is not None:
+                element._set_visible(visible)
+
+    @property
+    def _visible_child_elements(self) -> Iterable[Element]:
+        """
+        The children that the container doesn't cull. Containers that only render some of
+        their children override this.
+        """
+        return self._child_elements
+
+    def _can_render_to_cache(self) -> bool:
+        return all(
+            element._can_render_to_cache()
+            for element in self._elements_to_render
+            if element is not None
+        )
+
     def _render(
         self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
     ) -> None:
@@ -65,7 +206,8 @@ class GeometricContainer(Container, HasGeometry, ABC):
             element_x = x + element.get_x(w, element_w)
             element_y = y + element.get_y(h, element_h)
 
-            element.visible = self.visible
+            if element.visible != self.visible:
+                element._set_visible(self.visible)
             element.update_rect(surface, element_x, element_y, element_w, element_h)
 
     def _update_min_size(self) -> None:
@@ -83,6 +225,8 @@ class GeometricContainer(Container, HasGeometry, ABC):
             if (h := element.get_h()) > self._min_size.h:
                 self._min_size.h = h
 
+    _event_types = frozenset()
+
     def _event(self, event: pygame.event.Event) -> bool:
         
         for i in reversed(tuple(self._elements_to_render)):
@@ -1,6 +1,7 @@
 import pygame
 
-from typing import Optional, TYPE_CHECKING, NamedTuple
+from typing import Optional, TYPE_CHECKING, NamedTuple, Generator
+from contextlib import contextmanager
 from dataclasses import dataclass
 
 from ember import log
@@ -9,6 +10,7 @@ from ember.axis import HORIZONTAL
 
 from ember import common as _c
 from ember.common import (
+    ElementType,
     SequenceElementType,
     FOCUS_CLOSEST,
     FOCUS_AXIS_FORWARD,
@@ -18,6 +20,7 @@ from ember.common import (
 from ember.ui.element import Element
 from .focus_passthrough import FocusPassthroughContainer
 from .can_pivot import CanPivot
+from .geometric_container import GeometricContainer
 
 from ember.trait.trait import Trait
 from ember.spacing import SpacingType, FILL_SPACING, load_spacing, Spacing
@@ -28,7 +31,7 @@ if TYPE_CHECKING:
     pass
 
 
-class Grid(FocusPassthroughContainer, CanPivot):
+class Grid(FocusPassthroughContainer, CanPivot, GeometricContainer):
     spacing1 = Trait(
         FILL_SPACING,
         on_update=lambda self: self.update_min_size_next_tick(self),
@@ -59,6 +62,11 @@ class Grid(FocusPassthroughContainer, CanPivot):
         start_index: int
         sizes: tuple[float, ...]
 
+    class RowPlan(NamedTuple):
+        rows: list["Grid.Row"]
+        element_size1s: list[float]
+        row_size1s: list[float]
+
     def __init__(
         self,
         *elements: Optional[SequenceElementType],
@@ -76,6 +84,11 @@ class Grid(FocusPassthroughContainer, CanPivot):
 
         self._first_visible_element: Optional[int] = None
 
+        # The row plan is reused until the elements, the spacing or the size of the grid change
+        self._row_plan: Optional[Grid.RowPlan] = None
+        self._row_plan_key: Optional[tuple] = None
+        self._row_plan_sizes: Optional[dict[Element, tuple[float, float]]] = None
+
         if spacing is not None:
             horizontal_spacing, vertical_spacing = spacing, spacing
 
@@ -87,6 +100,29 @@ class Grid(FocusPassthroughContainer, CanPivot):
 
         super().__init__(*elements, **kwargs)
 
+    @contextmanager
+    def adding_element(
+        self, element: ElementType, update: bool = True
+    ) -> Generator[Optional["Element"], None, None]:
+        with super().adding_element(element, update) as element:
+            yield element
+        self._row_plan = None
+
+    def removing_element(
+        self, element: Optional["Element"], update: bool = True
+    ) -> None:
+        super().removing_element(element, update)
+        self._row_plan = None
+
+    def _child_geometry_modified(self, element: Element) -> None:
+        # The row plan only needs to be calculated again if the size of the element changed
+        if self._row_plan_sizes is not None and self._row_plan_sizes.get(element) == (
+            element.get_abs_rel_size1(self.rect[2 + self.axis]),
+            element.get_abs_rel_size2(),
+        ):
+            return
+        self._row_plan = None
+
     def _get_row_candidate(
         self, elements: list["Element"], spacing: float, max_items_in_row: int
     ) -> Row:
@@ -111,17 +147,51 @@ class Grid(FocusPassthroughContainer, CanPivot):
                 break
 
         return Grid.Row(max_items=max_items_in_row, start_index=0, sizes=tuple(sizes))
-    
-    def _calculate_child_positions(self):
-        elements = list(self._child_elements)
-        min_spacing1 = self.spacing1.get_min()
-        min_spacing2 = self.spacing2.get_min()
+
+    def _pack_rows(self, elements: list["Element"], spacing: float) -> list[Row]:
+        """
+        Pack the elements into rows in a single pass. Each row holds as many elements as fit in
+        the width of the grid. Only used when the spacing isn't negative, and the size2 of every
+        element doesn't depend on the space available to it.
+        """
+        sizes = [element.get_abs_rel_size2() for element in elements]
+        available_space = self.rect[3 - self.axis]
+        max_items = self.wrap_length if self.wrap_length is not None else len(elements)
 
         rows: list[Grid.Row] = []
         start_index = 0
 
-        # Calculate how many items should be on each row, and what their size1s should be
-        while True:
+        while start_index < len(sizes):
+            stop_index = min(len(sizes), start_index + max_items)
+            items_in_row = 1
+            total_size = 0
+            for n in range(start_index, stop_index):
+                total_size += sizes[n]
+                if available_space - spacing * (n - start_index) - total_size < 0:
+                    break
+                items_in_row = n - start_index + 1
+
+            rows.append(
+                Grid.Row(
+                    max_items=items_in_row,
+                    start_index=start_index,
+                    sizes=tuple(sizes[start_index : start_index + items_in_row]),
+                )
+            )
+            start_index += items_in_row
+
+        return rows
+
+    def _search_rows(self, elements: list["Element"], spacing: float) -> list[Row]:
+        """
+        Find the rows by trying fewer and fewer elements on each row. Used when the spacing is
+        negative, or the size2 of an element depends on the space available to it, such as a
+        Fill size.
+        """
+        rows: list[Grid.Row] = []
+        start_index = 0
+
+        while start_index < len(elements):
             max_items_in_row = (
                 self.wrap_length if self.wrap_length is not None else len(elements)
             )
@@ -130,7 +200,7 @@ class Grid(FocusPassthroughContainer, CanPivot):
             while True:
                 row_candidate = self._get_row_candidate(
                     elements[start_index:],
-                    spacing=min_spacing2,
+                    spacing=spacing,
                     max_items_in_row=max_items_in_row,
                 )
                 row_candidate.start_index = start_index
@@ -147,10 +217,35 @@ class Grid(FocusPassthroughContainer, CanPivot):
 
             rows.append(previous_row_candidate)
             start_index += len(previous_row_candidate.sizes)
-            if start_index == len(elements):
-                break
 
-        if self.uniform_size_allocation:
+        return rows
+
+    def _calculate_child_positions(self) -> RowPlan:
+        min_spacing2 = self.spacing2.get_min()
+        key = (
+            self.rect.w,
+            self.rect.h,
+            self.axis,
+            min_spacing2,
+            self.wrap_length,
+            self.uniform_size_allocation,
+        )
+        if self._row_plan is not None and self._row_plan_key == key:
+            return self._row_plan
+
+        elements = list(self._child_elements)
+
+        # Calculate how many items should be on each row, and what their size1s should be
+        if min_spacing2 < 0 or any(
+            element.rel_size2.max_value_intent for element in elements
+        ):
+            rows = self._search_rows(elements, min_spacing2)
+            element_size2s = None
+        else:
+            rows = self._pack_rows(elements, min_spacing2)
+            element_size2s = [size for row in rows for size in row.sizes]
+
+        if self.uniform_size_allocation and rows:
             max_items = max(i.max_items for i in rows)
             for i in range(len(rows)):
                 if rows[i].max_items != max_items:
@@ -178,11 +273,26 @@ class Grid(FocusPassthroughContainer, CanPivot):
                 max(element_size1s[start_index : start_index + len(row.sizes)])
             )
             start_index += len(row.sizes)
-        
-        return rows, element_size1s, row_size1s
-        
-        
-        
+
+        plan = Grid.RowPlan(rows, element_size1s, row_size1s)
+
+        # Sizes that depend on the element's own rect can change after the elements are
+        # positioned, so the plan can't be reused
+        if not any(
+            element.rel_size1.other_value_intent or element.rel_size2.other_value_intent
+            for element in elements
+        ):
+            self._row_plan = plan
+            self._row_plan_key = key
+            self._row_plan_sizes = (
+                None
+                if element_size2s is None
+                else dict(zip(elements, zip(element_size1s, element_size2s)))
+            )
+        else:
+            self._row_plan = None
+
+        return plan
 
     def _update_rect(
         self, surface: pygame.Surface, x: float, y: float, w: float, h: float
@@ -259,7 +369,7 @@ class Grid(FocusPassthroughContainer, CanPivot):
             element_rel_pos1 += row_size + spacing1
 
     def _update_min_size(self) -> None:
-        self._min_size.x, self._min_size.y = 20, 20
+        self._min_size.w, self._min_size.h = 20, 20
 
     def _render(
         self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
@@ -276,6 +386,8 @@ class Grid(FocusPassthroughContainer, CanPivot):
             if not i.visible:
                 break
 
+    _event_types = frozenset()
+
     def _event(self, event: pygame.event.Event) -> bool:
         for i in self._elements:
             if i is None:
@@ -1,4 +1,5 @@
 from typing import Union, Optional, Sequence, TYPE_CHECKING
+import math
 import pygame
 from abc import ABC, abstractmethod
 
@@ -64,11 +65,13 @@ class HasGeometry(Element, ABC):
         layer: Optional["ViewLayer"] = None,
         can_focus: bool = False,
     ):
-        self.rect = pygame.FRect(0, 0, 0, 0)
+        self.visible: bool = True
         """
-        A :code:`pygame.FRect` object containing the absolute position and size of the element. Read-only.
+        Is :code:`True` when any part of the element is visible on the screen. Read-only.
         """
 
+        self._rect: pygame.FRect = pygame.FRect(0, 0, 0, 0)
+
         self._int_rect = pygame.Rect(0, 0, 0, 0)
 
 
@@ -99,11 +102,6 @@ class HasGeometry(Element, ABC):
         self.w = w
         self.h = h
         
-        self.visible: bool = True
-        """
-        Is :code:`True` when any part of the element is visible on the screen. Read-only.
-        """
-
         self._animation_contexts: list[AnimationContext] = []
 
         if CascadingTraitValue.context_depth > 0:
@@ -114,6 +112,30 @@ class HasGeometry(Element, ABC):
     def unpack(self) -> tuple["HasGeometry",...]:
         return (self,)
 
+    @property
+    def rect(self) -> pygame.FRect:
+        """
+        A :code:`pygame.FRect` object containing the absolute position and size of the element. Read-only.
+        """
+        # Containers that cull their children don't move the culled children until needed
+        if not self.visible:
+            self._update_culled_rect()
+        return self._rect
+
+    @rect.setter
+    def rect(self, value: pygame.FRect) -> None:
+        self._rect = value
+
+    def _update_culled_rect(self) -> None:
+        """
+        Update the rect of the element if an ancestor culled it, and hasn't moved it since.
+        The outermost ancestors are updated first, as they move the ancestors inside them.
+        """
+        for n, container in enumerate(self.ancestry):
+            container._update_culled_child_rect(
+                self.ancestry[n + 1] if n + 1 < len(self.ancestry) else self
+            )
+
     def build(self) -> None:
         if self._has_built:
             return
@@ -166,9 +188,7 @@ class HasGeometry(Element, ABC):
                 "Element is queued for update but recieved an update first, removing from list.",
                 self,
             )
-            self.layer.rect_update_queue = list(
-                filter(lambda a: a is not self, self.layer.rect_update_queue)
-            )
+            self.layer.rect_update_queue.discard(self)
 
         if self.w.other_value_intent:
             if round(h, 3) != round(self.rect.h, 3):
@@ -176,7 +196,7 @@ class HasGeometry(Element, ABC):
                     f"Height was changed ({self.rect.h} -> {h}) and width calculation relies on height, queueing...",
                     self,
                 )
-                self.rect.update(x, y, w, h)
+                self._move_rect(x, y, w, h)
                 self.update_rect_next_tick()
                 return
 
@@ -186,7 +206,7 @@ class HasGeometry(Element, ABC):
                     f"Width was changed ({self.rect.w} -> {w}) and height calculation relies on width, queueing...",
                     self,
                 )
-                self.rect.update(x, y, w, h)
+                self._move_rect(x, y, w, h)
                 self.update_rect_next_tick()
                 return
 
@@ -194,7 +214,7 @@ class HasGeometry(Element, ABC):
             log.size.info("Size didn't change, cutting chain...")
             return
 
-        self.rect.update(x, y, w, h)
+        self._move_rect(x, y, w, h)
         self._int_rect.update(
             int(x),
             int(y),
@@ -213,16 +233,82 @@ class HasGeometry(Element, ABC):
         self, surface: pygame.Surface, x: float, y: float, w: float, h: float
     ) -> None:
         ...
+
+    def _move_rect(self, x: float, y: float, w: float, h: float) -> None:
+        """
+        Update the rect, marking both the old and the new area as dirty.
+        """
+        if self.rect[:] != (x, y, w, h):
+            self.mark_dirty()
+            self.rect.update(x, y, w, h)
+            self.mark_dirty()
+            self._layout_changed()
+
+    def _layout_changed(self) -> None:
+        """
+        Called when the element is moved, resized or removed from its container. The ancestors
+        that retain their render check again that it blends in the same way as drawing the
+        children directly, as moving the element can change which translucent elements overlap.
+        """
+        for container in self.ancestry:
+            if getattr(container, "_render_cache_exact", None) is not None:
+                container._render_cache_exact = None
+
+    def mark_dirty(self) -> None:
+        """
+        Include the area covered by the element in the dirty rects returned by the next
+        :py:meth:`View.update<ember.ui.View.update>` call. Any retained render caches of
+        the element's ancestors are cleared.
+        """
+        if self.layer is None:
+            return
+        for container in (*self.ancestry, self):
+            if getattr(container, "_render_cache_checked", False):
+                container._clear_render_cache()
+        if self.rect:
+            self.layer.dirty_rects.append(self._get_covered_rect())
+
+    def _get_covered_rect(self) -> pygame.Rect:
+        """
+        Returns the smallest integer rect that contains the element's rect.
+        """
+        left, top = math.floor(self.rect.x), math.floor(self.rect.y)
+        return pygame.Rect(
+            left,
+            top,
+            math.ceil(self.rect.right) - left,
+            math.ceil(self.rect.bottom) - top,
+        )
+
+    def _get_render_bounds(self) -> pygame.Rect:
+        """
+        Returns the area that the element (and its children, if it has any) draws to.
+        """
+        return self._get_covered_rect()
+
+    def _set_visible(self, visible: bool) -> None:
+        """
+        Used internally by the library. Set :code:`visible` on the element and on its
+        descendants. Used by containers that cull their children, so that the descendants of a
+        culled child aren't treated as visible, for example when resolving the hovered elements.
+        """
+        self.visible = visible
+
+    def _can_render_to_cache(self) -> bool:
+        """
+        Returns False if the element can't be drawn to an offscreen surface, for example because
+        its materials depend on the pixels behind it. Used by the retained render cache of
+        :py:class:`GeometricContainer<ember.ui.GeometricContainer>`.
+        """
+        return True
         
     def update_rect_next_tick(self) -> None:
         """
         On the next view update, call update_rect for this element.
         """
-        if (
-            self.layer is not None
-            and self.parent is not None
-            and self.parent not in self.layer.rect_update_queue
-        ):
+        if self.layer is not None and self.parent is not None:
+            if self.parent in self.layer.rect_update_queue:
+                return
             log.size.info(
                 f"Queued parent {self.parent} for rect update next tick.", self
             )
@@ -234,9 +320,9 @@ class HasGeometry(Element, ABC):
         """
         On the next view update, call update_min_size for this element.
         """
-        if self.layer is not None and self not in self.layer.min_size_update_queue:
+        if self.layer is not None:
             log.size.info("Queued for min size update next tick.", self)
-            self.layer.min_size_update_queue.append((self, must_update_parent))
+            self.layer.min_size_update_queue.append(self, must_update_parent)
         else:
             log.size.info("No layer - could not queue min size update.", self)
 
@@ -313,8 +399,15 @@ class HasGeometry(Element, ABC):
             if self.parent is not None:
                 self.update_rect_next_tick()
 
-                with log.size.indent(f"-> parent."):
-                    self.parent.update_min_size()
+                self.parent._child_geometry_modified(self)
+                if self.layer is not None:
+                    # The parent is updated once all of its changed children have been updated,
+                    # rather than once for each child
+                    log.size.info("Queued parent for min size update.", self)
+                    self.layer.min_size_update_queue.append(self.parent)
+                else:
+                    with log.size.indent(f"-> parent."):
+                        self.parent.update_min_size()
             else:
                 log.size.info("No parent - cutting chain...", self)
 
@@ -343,6 +436,8 @@ class HasGeometry(Element, ABC):
         """
         Used internally by the library. Updates the element, with transitions taken into consideration.
         """
+        if self._animation_contexts:
+            self.mark_dirty()
         for anim_context in self._animation_contexts[:]:
             if anim_context._update():
                 anim_context._finish()
@@ -355,8 +450,21 @@ class HasGeometry(Element, ABC):
         """
 
     def event(self, event: pygame.event.Event) -> bool:
+        if (
+            event_types := self._get_subtree_event_types()
+        ) is not None and event.type not in event_types:
+            return False
         return self._event(event)
 
+    def _get_subtree_event_types(self) -> Optional[frozenset[int]]:
+        """
+        Returns the event types handled by the element or any of its descendants, or None if
+        any event type might be handled. Events of other types aren't passed to the element.
+        """
+        return self._handled_event_types
+
+    _event_types = frozenset()
+
     def _event(self, event: pygame.event.Event) -> bool:
         """
         Called by the parent of the element for each Pygame event,
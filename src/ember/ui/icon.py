@@ -130,11 +130,14 @@ class Icon(MultiLayerSurfacable):
 
         if isinstance(name, str):
             self._name = name
+            # The IconFont caches its surfaces, so they are shared with other Icons
             surfaces = self._font.value.get(name)
+            shared = True
 
         elif isinstance(name, pygame.Surface):
             self._name = None
             surfaces = (name,)
+            shared = False
 
         layers = list(range(1, len(surfaces) + 1))
         self._layers = layers
@@ -142,7 +145,7 @@ class Icon(MultiLayerSurfacable):
         self._surface_width, self._surface_height = surfaces[0].get_size()
 
         with log.mls.indent("Icon changed, generating surfaces...", self):
-            self._generate_surface(layers, surfaces)
+            self._generate_surface(layers, surfaces, shared=shared)
 
         if _update:
             self.update_min_size_next_tick()
\ No newline at end of file
@@ -70,6 +70,8 @@ class InteractiveLinearGauge(Gauge, CanDisable, CanFocus, ClickActivateHybrid, C
     def _click_to_adjust_value(self) -> None:
         self._move_to_mouse_pos(self.ValueCause.CLICK)
 
+    _event_types = frozenset({pygame.MOUSEWHEEL, pygame.KEYDOWN})
+
     def _event(self, event: pygame.event.Event) -> bool:
         if super()._event(event):
             return True
@@ -43,6 +43,10 @@ class MaskedContainer(GeometricContainer, ABC):
             log.size.info(f"Created subsurface with rect {self.rect}", self)
         return self._subsurface
 
+    def _can_render_to_cache(self) -> bool:
+        # The subsurface is created from the surface passed to render, so it can't be drawn offscreen
+        return False
+
     def event(self, event: pygame.event.Event) -> bool:
         if event.type in {
             pygame.MOUSEBUTTONDOWN,
@@ -0,0 +1,65 @@
+from typing import Any
+
+from .. import common as _c
+from .text import Text
+
+from ..material.stats import material_stats
+
+
+class MaterialStatsOverlay(Text):
+    """
+    A Text element that shows the materials that have rendered the most surfaces since the
+    counters were last reset, with the number of render calls, cache hits and the bytes held
+    by each. Creating the element enables :py:attr:`material_stats.enabled<ember.material.MaterialStats.enabled>`.
+
+    Place it in a ZStack above the rest of the UI to use it as an overlay.
+    """
+
+    def __init__(
+        self,
+        count: int = 5,
+        interval: float = 0.5,
+        sort_by: str = "renders",
+        **kwargs: Any,
+    ):
+        self.count: int = count
+        """
+        The number of materials to show.
+        """
+
+        self.interval: float = interval
+        """
+        The number of seconds between updates of the text.
+        """
+
+        self.sort_by: str = sort_by
+        """
+        The counter that the materials are sorted by.
+        """
+
+        self._time_until_refresh: float = 0
+
+        material_stats.enabled = True
+        super().__init__(**kwargs)
+
+    def __repr__(self) -> str:
+        return "<MaterialStatsOverlay>"
+
+    def _update(self) -> None:
+        super()._update()
+        self._time_until_refresh -= _c.delta_time
+        if self._time_until_refresh <= 0:
+            self._time_until_refresh = self.interval
+            self.set_text(self._get_text())
+
+    def _get_text(self) -> str:
+        snapshot = material_stats.snapshot()
+        lines = [
+            f"{material}: {values['renders']} renders, {values['hits']} hits, "
+            f"{values['bytes']} B"
+            for material, values in sorted(
+                snapshot["instances"].items(), key=lambda i: -i[1][self.sort_by]
+            )[: self.count]
+        ]
+        lines.append(f"Surface cache: {snapshot['surface_cache_bytes']} B")
+        return "\n".join(lines)
@@ -68,6 +68,9 @@ class MultiLayerSurfacable(Surfacable):
 
         self._surfaces: list[pygame.Surface] = []
         self._layers: list[int] = []
+        # The indices of the surfaces that are shared with other elements, such as surfaces from
+        # the text render cache. These are copied before materials are applied to them.
+        self._shared_surfaces: set[int] = set()
         self._static_surface: Optional[pygame.Surface] = None
 
         super().__init__(
@@ -86,14 +89,36 @@ class MultiLayerSurfacable(Surfacable):
         Renders the surface layers.
         """
         if self._static_surface is not None:
-            self._static_surface.set_alpha(alpha)
+            shared = 0 in self._shared_surfaces and self._static_surface is self._surfaces[0]
+            if shared and alpha != 255:
+                # The surface is shared with other elements, so it is copied before its alpha
+                # is set
+                self._static_surface = self._claim_surface(0)
+                shared = False
+            if not shared:
+                self._static_surface.set_alpha(alpha)
             surface.blit(self._static_surface, pos)
+        elif self._surfaces:
+            # The materials are reapplied every tick, so the element is always dirty
+            self.mark_dirty()
 
         for layer, surf in zip(self._layers, self._surfaces):
             new_surf = surf.copy()
             self._apply_material_to_surface(new_surf, layer, surface, pos)
             surface.blit(new_surf, pos)
 
+    def _get_render_bounds(self) -> pygame.Rect:
+        # The surface can overflow the rect, either from its left edge or its centre
+        bounds = self._get_covered_rect()
+        return bounds.inflate(
+            max(0, self._surface_width - bounds.w) * 2 + 2,
+            max(0, self._surface_height - bounds.h) * 2 + 2,
+        )
+
+    def _can_render_to_cache(self) -> bool:
+        # Dynamic surfaces sample the destination surface when their materials are applied
+        return self._static_surface is not None or not self._surfaces
+
     def _get_surface(self, alpha: int = 255) -> pygame.Surface:
         surface = self._static_surface.copy()
         surface.set_alpha(alpha)
@@ -120,8 +145,7 @@ class MultiLayerSurfacable(Surfacable):
         will *only* be applied to the surface if the material updates every tick.
         """
 
-        if layer == 0:
-            # log.mls.info(self, "Layer=0, no material applied.")
+        if not self._will_apply_material(layer, update_mode):
             return
 
         if layer == 1:
@@ -131,10 +155,6 @@ class MultiLayerSurfacable(Surfacable):
         else:
             material = self.tertiary_material
 
-        if material.UPDATES_EVERY_TICK == update_mode:
-            # log.mls.info(self, f"Material updates_every_tick = {update_mode}; no material applied.")
-            return
-
         # log.mls.info(self, f"Layer={layer}, applying style material.")
         material.render(self, destination, pos, destination.get_size(), alpha=255)
         surface.blit(
@@ -143,18 +163,52 @@ class MultiLayerSurfacable(Surfacable):
             special_flags=pygame.BLEND_RGB_ADD,
         )
 
+    def _will_apply_material(self, layer: int, update_mode: bool = False) -> bool:
+        """
+        Returns :code:`True` if :py:meth:`_apply_material_to_surface` would apply a material
+        to a surface of the given layer.
+        """
+        if layer == 0:
+            return False
+
+        if layer == 1:
+            material = self.primary_material
+        elif layer == 2:
+            material = self.secondary_material
+        else:
+            material = self.tertiary_material
+
+        return material.UPDATES_EVERY_TICK != update_mode
+
+    def _claim_surface(self, n: int) -> pygame.Surface:
+        """
+        Returns the surface at index :code:`n`, copying it first if it is shared with other
+        elements, so that it can be modified.
+        """
+        if n in self._shared_surfaces:
+            self._surfaces[n] = self._surfaces[n].copy()
+            self._shared_surfaces.discard(n)
+        return self._surfaces[n]
+
     def _generate_surface(
         self,
         layers: Sequence[int],
         surfaces: Sequence[pygame.Surface],
         reapply: bool = False,
+        shared: bool = False,
     ) -> None:
         """
         Given a list of surfaces and their layer codes, generates the required surfaces for rendering.
         If :code:`reapply` is :code:`False`, the surfaces will be assumed to be black. If :code:`True`,
         the function will ensure that the surfaces are black before material application.
+        If :code:`shared` is :code:`True`, the surfaces are copied before they are modified.
         """
-        self._surfaces = surfaces
+        self._surfaces = list(surfaces)
+        if shared:
+            self._shared_surfaces = set(range(len(self._surfaces)))
+        elif not reapply:
+            self._shared_surfaces = set()
+        self.mark_dirty()
         if self._get_is_static(layers):
             self._generate_static_surface(layers, surfaces, reapply=reapply)
         else:
@@ -206,9 +260,15 @@ class MultiLayerSurfacable(Surfacable):
         If :code:`reapply` is :code:`False`, the surfaces will be assumed to be black. If :code:`True`,
         the function will ensure that the surfaces are black before material application.
         """
-        for n, (layer, surf) in enumerate(zip(layers, surfaces)):
-            if reapply:
-                surf.fill(0xFFFFFF, special_flags=pygame.BLEND_RGB_SUB)
+        for n, layer in enumerate(layers[: len(surfaces)]):
+            # Shared surfaces haven't been modified, so they don't need to be made black
+            if reapply and n not in self._shared_surfaces:
+                self._surfaces[n].fill(0xFFFFFF, special_flags=pygame.BLEND_RGB_SUB)
+            if self._will_apply_material(layer, update_mode=True) or (
+                n == 0 and len(surfaces) > 1
+            ):
+                self._claim_surface(n)
+            surf = self._surfaces[n]
             self._apply_material_to_surface(surf, layer, surf, (0, 0), update_mode=True)
 
             if n == 0:
@@ -218,7 +278,10 @@ class MultiLayerSurfacable(Surfacable):
         log.mls.info("Generated static surface.", self)
 
     def _generate_dynamic_surfaces(
-        self, surfaces: Sequence[pygame.Surface], reapply: bool = False
+        self,
+        layers: Sequence[int],
+        surfaces: Sequence[pygame.Surface],
+        reapply: bool = False,
     ) -> None:
         """
         Generates a list of surfaces. If the material for a surface needs to update every tick, the surface is
@@ -230,8 +293,11 @@ class MultiLayerSurfacable(Surfacable):
         the function will ensure that the surfaces are black before material application.
         """
         self._static_surface = None
-        for layer, surf in zip(self._layers, surfaces):
-            if reapply:
-                surf.fill(0xFFFFFF, special_flags=pygame.BLEND_RGB_SUB)
+        for n, layer in enumerate(layers[: len(surfaces)]):
+            if reapply and n not in self._shared_surfaces:
+                self._surfaces[n].fill(0xFFFFFF, special_flags=pygame.BLEND_RGB_SUB)
+            if self._will_apply_material(layer, update_mode=True):
+                self._claim_surface(n)
+            surf = self._surfaces[n]
             self._apply_material_to_surface(surf, layer, surf, (0, 0), update_mode=True)
         log.mls.info("Generated dynamic surfaces.", self)
@@ -77,6 +77,8 @@ class Scroll(MultiElementContainer, ABC):
             )
             self._post_event(event)
 
+    _event_types = frozenset({pygame.MOUSEWHEEL})
+
     def _event(self, event: pygame.event.Event) -> bool:
         if super()._event(event):
             return True
@@ -24,7 +24,7 @@ class Panel(HasGeometry):
         w: Optional[SizeType] = None,
         h: Optional[SizeType] = None,
     ):
-        self.material: Optional["Material"] = (
+        self._material: Optional["Material"] = (
             material
             if isinstance(material, Material) or material is None
             else Color(material)
@@ -34,16 +34,37 @@ class Panel(HasGeometry):
     def __repr__(self) -> str:
         return "<Panel>"
 
+    @property
+    def material(self) -> Optional["Material"]:
+        """
+        The material that the Panel is filled with.
+        """
+        return self._material
+
+    @material.setter
+    def material(self, material: Optional["Material"]) -> None:
+        if material is not self._material:
+            self._material = material
+            self.mark_dirty()
+
     def _render(
         self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
     ) -> None:
-        rect = self.rect.move([-i for i in surface.get_abs_offset()])
+        abs_offset = surface.get_abs_offset()
+        rect = self.rect.move(offset[0] - abs_offset[0], offset[1] - abs_offset[1])
         if self.material is not None:
             x = int(rect.x)
             y = int(rect.y)
             w = int(rect.right - x)
             h = int(rect.bottom - y)
             self.material.draw(self, surface, (x,y), (w,h), alpha)
+            if self.material.UPDATES_EVERY_TICK:
+                self.mark_dirty()
+
+    def _can_render_to_cache(self) -> bool:
+        return self.material is None or not (
+            self.material.UPDATES_EVERY_TICK or self.material.DEPENDS_ON_BACKGROUND
+        )
 
 Panel.w.default_value = FILL
 Panel.h.default_value = FILL
@@ -62,6 +62,8 @@ class Resizable(Box):
         if self.handles and not self._resizing:
             self._is_hovering_resizable_edge()
 
+    _event_types = frozenset({pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.MOUSEMOTION})
+
     def _event(self, event: pygame.event.Event) -> bool:
         if self._handle_hovering:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
@@ -116,12 +118,12 @@ class Resizable(Box):
 
         if self._handle_hovering is None:
             if value in [LEFT, RIGHT]:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_SIZEWE)
+                _c.set_cursor(pygame.SYSTEM_CURSOR_SIZEWE)
             else:
-                pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_SIZENS)
+                _c.set_cursor(pygame.SYSTEM_CURSOR_SIZENS)
 
         elif value is None:
-            pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+            _c.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
         self._handle_hovering = value
 
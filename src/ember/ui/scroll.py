@@ -4,6 +4,7 @@ from typing import Iterable, Optional, Union, Sequence
 import pygame
 
 from .element import Element
+from .has_geometry import HasGeometry
 from .masked_container import MaskedContainer
 from .box import Box
 from .can_pivot import CanPivot
@@ -19,7 +20,7 @@ from ember.trait import Trait
 
 from ember import log
 
-class Scroll(MaskedContainer, Box, CanPivot):
+class Scroll(CanPivot, MaskedContainer, Box):
     scrollbar_class: type[ScrollBar] = NotImplemented
 
     def __init__(
@@ -95,6 +96,8 @@ class Scroll(MaskedContainer, Box, CanPivot):
     def _child_elements(self) -> Iterable[Element]:
         return itertools.chain(super()._child_elements, (self._scrollbar,))
 
+    _event_types = frozenset({VALUEMODIFIED, pygame.MOUSEWHEEL})
+
     def _event(self, event: pygame.event.Event) -> bool:
         if event.type == VALUEMODIFIED and event.element is self._scrollbar:
             with event.animation:
@@ -117,8 +120,8 @@ class Scroll(MaskedContainer, Box, CanPivot):
             return
         self._scroll_value = value
         position = PivotablePosition(-self._scroll_value, 0, watching=self)
-        self.cascading.add(Element.x(position))
-        self.cascading.add(Element.y(~position))
+        self.cascading.add(HasGeometry.x(position))
+        self.cascading.add(HasGeometry.y(~position))
         self.scrollbar.value = value
 
     @scrollbar.setter
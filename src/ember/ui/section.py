@@ -48,6 +48,8 @@ class Section(Box):
             log.nav.info(f"-> child {self._element}.")
             return self._element._focus_chain(direction)
 
+    _event_types = frozenset({pygame.KEYDOWN, pygame.JOYBUTTONDOWN})
+
     def _event(self, event: pygame.event.Event) -> bool:
         if (event.type == pygame.KEYDOWN and event.key == pygame.K_RETURN) or (
             event.type == pygame.JOYBUTTONDOWN and event.button == 0
@@ -1,13 +1,17 @@
 import pygame
 import math
+import bisect
+from contextlib import contextmanager
 
-from typing import Optional, TYPE_CHECKING
+from typing import Optional, TYPE_CHECKING, Generator, Iterable
 
 from ember import log
 from ember import axis
+from ember.axis import Axis
 
 from ember import common as _c
 from ember.common import (
+    ElementType,
     SequenceElementType,
     FOCUS_CLOSEST,
     FOCUS_AXIS_FORWARD,
@@ -35,7 +39,7 @@ class Stack(FocusPassthroughContainer, CanPivot, GeometricContainer):
 
     spacing = Trait(
         FILL_SPACING,
-        on_update=lambda self: self.update_min_size_next_tick(self),
+        on_update=lambda self: self._spacing_modified(),
         load_value_with=load_spacing,
     )
 
@@ -45,13 +49,70 @@ class Stack(FocusPassthroughContainer, CanPivot, GeometricContainer):
         spacing: Optional[SpacingType] = None,
         **kwargs,
     ):
-        self._first_visible_element: Optional[int] = None
+        self._visible_elements: Optional[tuple[Element, ...]] = None
+        self._visible_start: int = 0
+        self._visible_stop: int = 0
+
+        # The layout of the elements relative to the position of the stack. If only the position
+        # of the stack changes, the layout is translated rather than calculated again.
+        self._layout: list[tuple[float, float, float, float]] = []
+        self._layout_starts: list[float] = []
+        self._layout_ends: list[float] = []
+        self._layout_valid: bool = False
+        self._min_size_valid: bool = False
+        self._min_size_axis: Optional[Axis] = None
+        self._layout_key: Optional[tuple] = None
+        self._layout_surface: Optional[pygame.Surface] = None
+        # The index of each element in the layout, and the position of the stack when the rect
+        # of each element was last updated. The elements outside of the visible window aren't
+        # moved with the stack until their rects are read.
+        self._layout_indices: dict[Element, int] = {}
+        self._layout_origins: list[tuple[float, float]] = []
+
         self.spacing = spacing
         super().__init__(*elements, **kwargs)
 
+    def _invalidate_layout(self) -> None:
+        self._layout_valid = False
+        self._min_size_valid = False
+
+    def _spacing_modified(self) -> None:
+        self._invalidate_layout()
+        self.update_min_size_next_tick(self)
+
+    @contextmanager
+    def adding_element(
+        self, element: ElementType, update: bool = True
+    ) -> Generator[Optional["Element"], None, None]:
+        with super().adding_element(element, update) as element:
+            yield element
+        self._visible_elements = None
+        self._invalidate_layout()
+
+    def removing_element(
+        self, element: Optional["Element"], update: bool = True
+    ) -> None:
+        super().removing_element(element, update)
+        self._visible_elements = None
+        self._invalidate_layout()
+
+    def _child_geometry_modified(self, element: Element) -> None:
+        self._invalidate_layout()
+
     def _update_rect(
         self, surface: pygame.Surface, x: float, y: float, w: float, h: float
     ) -> None:
+        if (
+            self._layout_valid
+            and self._visible_elements is not None
+            and self._layout_key == (w, h, self.axis)
+        ):
+            self._translate_layout(surface)
+            return
+
+        # The old layout can't be used to update the rects of culled elements while the new
+        # one is calculated
+        self._layout_indices = {}
         elements = tuple(self._elements_to_render)
  
         spacing = self.spacing.get_min()
@@ -81,15 +142,22 @@ class Stack(FocusPassthroughContainer, CanPivot, GeometricContainer):
             self.rect[2 + self.axis] / 2
             - (sum(element_sizes.values()) + spacing * (len(elements) - 1)) / 2
         )
-        
-        self._first_visible_element = None
 
-        for element_n, element in enumerate(elements):
+        layout = []
+        # The start and end of each element along the axis, used to find the visible elements
+        starts = []
+        ends = []
+        end = -math.inf
+
+        for element in elements:
             element_rel_size1 = element_sizes[element]
             element_rel_size2 = element.get_abs_rel_size2(self.rect[3 - self.axis] - abs(element.rel_pos2.value))
             
             element_rel_pos2 = element.rel_pos2.get(self.rect[3 - self.axis], element_rel_size2, self.axis)
 
+            layout.append(
+                (element_rel_pos1, element_rel_pos2, element_rel_size1, element_rel_size2)
+            )
             element.update_rect(
                 surface,
                 rel_pos1=self.rect[self.axis] + element_rel_pos1,
@@ -98,21 +166,91 @@ class Stack(FocusPassthroughContainer, CanPivot, GeometricContainer):
                 rel_size2=element_rel_size2
             )
 
-            element.visible = True
-            if (
-                element.rect[self.axis] + element.rect[2 + self.axis]
-                < surface.get_abs_offset()[self.axis]
-                or element.rect[self.axis]
-                > surface.get_abs_offset()[self.axis] + surface.get_size()[self.axis]
-            ):
-                element.visible = False
-
-            if element.visible and self._first_visible_element is None:
-                self._first_visible_element = element_n
+            start = element.rect[self.axis] - self.rect[self.axis]
+            starts.append(start)
+            # Kept ascending so that it can be bisected, even if the spacing is negative
+            end = max(end, start + element.rect[2 + self.axis])
+            ends.append(end)
 
             element_rel_pos1 += element_rel_size1 + spacing
 
+        self._layout = layout
+        self._layout_starts = starts
+        self._layout_ends = ends
+        self._layout_valid = True
+        self._layout_key = (w, h, self.axis)
+        self._layout_surface = surface
+        self._layout_indices = {element: n for n, element in enumerate(elements)}
+        self._layout_origins = [self.rect.topleft] * len(elements)
+
+        self._visible_elements = elements
+        self._visible_start, self._visible_stop = self._get_visible_window(surface)
+
+        for n, element in enumerate(elements):
+            visible = self.visible and self._visible_start <= n < self._visible_stop
+            if element.visible != visible:
+                element._set_visible(visible)
+
+    def _get_visible_window(self, surface: pygame.Surface) -> tuple[int, int]:
+        clip_start = surface.get_abs_offset()[self.axis] - self.rect[self.axis]
+        clip_end = clip_start + surface.get_size()[self.axis]
+        start = bisect.bisect_left(self._layout_ends, clip_start)
+        return start, max(start, bisect.bisect_right(self._layout_starts, clip_end))
+
+    def _translate_layout(self, surface: pygame.Surface) -> None:
+        """
+        Called when only the position of the stack has changed, such as when it is scrolled.
+        Only the rects of the elements in the visible window are updated. The rects of the
+        other elements are updated when they are read.
+        """
+        elements = self._visible_elements
+        old_start, old_stop = self._visible_start, self._visible_stop
+        start, stop = self._get_visible_window(surface)
+
+        # The descendants of the elements that leave the window are hidden too, so that reading
+        # their rects updates them
+        for n in range(old_start, old_stop):
+            if not start <= n < stop:
+                elements[n]._set_visible(False)
+
+        for n in range(start, stop):
+            self._update_element_rect(surface, n)
+            if self.visible and not elements[n].visible:
+                elements[n]._set_visible(True)
+
+        self._visible_start, self._visible_stop = start, stop
+        self._layout_surface = surface
+
+    @property
+    def _visible_child_elements(self) -> Iterable[Element]:
+        if self._visible_elements is None:
+            return self._child_elements
+        return self._visible_elements[self._visible_start : self._visible_stop]
+
+    def _update_element_rect(self, surface: pygame.Surface, n: int) -> None:
+        rel_pos1, rel_pos2, rel_size1, rel_size2 = self._layout[n]
+        # Set first, as update_rect reads the rect of the element
+        self._layout_origins[n] = self.rect.topleft
+        self._visible_elements[n].update_rect(
+            surface,
+            rel_pos1=self.rect[self.axis] + rel_pos1,
+            rel_pos2=self.rect[1 - self.axis] + rel_pos2,
+            rel_size1=rel_size1,
+            rel_size2=rel_size2,
+        )
+
+    def _update_culled_child_rect(self, element: Element) -> None:
+        n = self._layout_indices.get(element)
+        if n is not None and self._layout_origins[n] != self.rect.topleft:
+            self._update_element_rect(self._layout_surface, n)
+
     def _update_min_size(self) -> None:
+        # The minimum size only depends on the elements, so it isn't calculated again when the
+        # position of the stack changes
+        if self._min_size_valid and self._min_size_axis == self.axis:
+            return
+        self._min_size_valid = True
+        self._min_size_axis = self.axis
         elements = tuple(self._elements_to_render)
         if elements:
             size = 0
@@ -134,25 +272,30 @@ class Stack(FocusPassthroughContainer, CanPivot, GeometricContainer):
     def _render(
         self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
     ) -> None:
-        for n, i in enumerate(tuple(self._elements_to_render)[self._first_visible_element :]):
-            if not i.visible:
-                break
-            i.render(surface, offset, alpha=alpha)
+        if self._visible_elements is None:
+            super()._render(surface, offset, alpha)
+            return
+        elements = self._visible_elements
+        for n in range(self._visible_start, self._visible_stop):
+            elements[n].render(surface, offset, alpha=alpha)
 
     def _update(self) -> None:
-        for i in tuple(self._elements_to_render)[self._first_visible_element :]:
-            i.update()
-            if not i.visible:
-                break
+        if self._visible_elements is None:
+            super()._update()
+            return
+        elements = self._visible_elements
+        for n in range(self._visible_start, self._visible_stop):
+            elements[n].update()
+
+    _event_types = frozenset()
 
     def _event(self, event: pygame.event.Event) -> bool:
-        for i in tuple(self._elements_to_render)[self._first_visible_element :]:
-            if i is None:
-                continue
-            if i.event(event):
+        if self._visible_elements is None:
+            return super()._event(event)
+        elements = self._visible_elements
+        for n in range(self._visible_start, self._visible_stop):
+            if elements[n].event(event):
                 return True
-            if not i.visible:
-                break
         return False
 
     def _focus_chain(
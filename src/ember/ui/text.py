@@ -7,6 +7,7 @@ from ember.ui.multi_layer_surfacable import MultiLayerSurfacable
 from ..font.base_font import Font
 from ..font.line import Line
 from ..font.variant import TextVariant
+from ..font.render_cache import render_cache
 
 from ..size import SizeType, OptionalSequenceSizeType, Fit
 from ember.position import (
@@ -52,6 +53,13 @@ class Text(MultiLayerSurfacable):
     ):
         self._text: str = text
 
+        # The arguments and result of the last render, so that the lines that haven't changed
+        # can be reused when the text is set
+        self._render_key: Optional[tuple] = None
+        self._render_result: Optional[
+            tuple[str, list[pygame.Surface], list[Line]]
+        ] = None
+
         if isinstance(variant, Sequence):
             variant = tuple(variant)
         elif variant is not None:
@@ -166,12 +174,17 @@ class Text(MultiLayerSurfacable):
             None if self.rect.w == 0 or isinstance(self.w, Fit) else self.rect.w
         )
         
-        surfaces, self.lines = self.font.render(
+        render_key = (self.font, self.variant, max_width)
+        surfaces, self.lines = render_cache.render(
+            self.font,
             self._text,
             variant=self.variant,
             max_width=max_width,
             align=CENTER,
+            previous=self._render_result if render_key == self._render_key else None,
         )
+        self._render_key = render_key
+        self._render_result = (self._text, surfaces, self.lines)
 
         if (self._surface_width, self._surface_height) != (
             size := surfaces[0].get_size()
@@ -182,7 +195,7 @@ class Text(MultiLayerSurfacable):
 
         self._layers = self.font.get_layers(self.variant)
 
-        self._generate_surface(self._layers, surfaces)
+        self._generate_surface(self._layers, surfaces, shared=True)
 
         if self._static_surface:
             log.size.info(
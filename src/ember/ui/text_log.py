@@ -0,0 +1,384 @@
+import pygame
+from collections import deque
+from typing import Union, Optional, TYPE_CHECKING, Sequence, Iterable
+
+from .. import log
+from ..common import ColorType
+from ember.ui.multi_layer_surfacable import MultiLayerSurfacable
+
+from ..font.base_font import Font
+from ..font.variant import TextVariant
+
+from ..size import SizeType, OptionalSequenceSizeType, FILL
+from ember.position import (
+    PositionType,
+    SequencePositionType,
+    LEFT,
+)
+
+if TYPE_CHECKING:
+    from ..material.material import Material
+
+from ember.trait import Trait
+
+
+class TextLog(MultiLayerSurfacable):
+    """
+    An Element that displays a stream of lines, such as the output of a console. Lines are
+    added with :py:meth:`append_line` or :py:meth:`extend`, and the most recent lines are shown,
+    scrolling up as new lines are added.
+
+    Only the rows that fit in the element are kept rendered, in a surface that is used as a
+    ring buffer. Adding a line renders only that line, so the cost of adding a line doesn't
+    depend on how many lines have been added before it. At most :code:`max_lines` lines are
+    kept, and the oldest lines are removed when more are added.
+
+    Materials that don't update every tick are applied to each line as it is added.
+    """
+
+    variant: TextVariant = Trait((), on_update=lambda self: self._rebuild())
+
+    font = Trait(None, on_update=lambda self: self._rebuild())
+
+    def __init__(
+        self,
+        lines: Iterable[str] = (),
+        max_lines: int = 1000,
+        color: Optional[ColorType] = None,
+        material: Optional["Material"] = None,
+        primary_material: Optional["Material"] = None,
+        secondary_material: Optional["Material"] = None,
+        tertiary_material: Optional["Material"] = None,
+        variant: Union[TextVariant, Sequence[TextVariant], None] = None,
+        font: Optional[Font] = None,
+        rect: Union[pygame.rect.RectType, Sequence, None] = None,
+        pos: Optional[SequencePositionType] = None,
+        x: Optional[PositionType] = None,
+        y: Optional[PositionType] = None,
+        size: OptionalSequenceSizeType = None,
+        w: Optional[SizeType] = None,
+        h: Optional[SizeType] = None,
+    ):
+        self._lines: deque[str] = deque()
+        # The number of rows that each line was wrapped into, or None for lines that were
+        # hidden by newer lines when the rows were last rendered
+        self._line_rows: deque[Optional[int]] = deque()
+        # The total number of rows of the lines whose rows are known
+        self._known_rows: int = 0
+        self._max_lines: int = max_lines
+
+        # A surface for each layer containing the rows, and a surface with the materials
+        # applied, if the element is static. The rows are written to the slot after the last
+        # written row, wrapping around to the top of the surface.
+        self._rings: list[pygame.Surface] = []
+        self._static_ring: Optional[pygame.Surface] = None
+        self._capacity: int = 0
+        self._head: int = 0
+        self._ring_width: int = 0
+
+        if isinstance(variant, Sequence):
+            variant = tuple(variant)
+        elif variant is not None:
+            variant = (variant,)
+
+        self.variant = variant
+        self.font = font
+
+        super().__init__(
+            # MultiLayerSurfacable
+            color=color,
+            material=material,
+            primary_material=primary_material,
+            secondary_material=secondary_material,
+            tertiary_material=tertiary_material,
+            rect=rect,
+            pos=pos,
+            x=x,
+            y=y,
+            size=size,
+            w=w,
+            h=h,
+            can_focus=False,
+        )
+
+        self.extend(lines)
+
+    def __repr__(self) -> str:
+        return f"<TextLog({len(self._lines)} lines)>"
+
+    @property
+    def lines(self) -> tuple[str, ...]:
+        """
+        The lines that are kept, from oldest to newest. Read-only.
+        """
+        return tuple(self._lines)
+
+    @property
+    def max_lines(self) -> int:
+        """
+        The maximum number of lines that are kept. When a line is added and there are already
+        this many lines, the oldest line is removed.
+        """
+        return self._max_lines
+
+    @max_lines.setter
+    def max_lines(self, value: int) -> None:
+        self._max_lines = value
+        while len(self._lines) > value:
+            self._remove_oldest_line()
+        self._rebuild()
+
+    @property
+    def _pitch(self) -> int:
+        return self.font.line_height + self.font.line_spacing
+
+    @property
+    def _visible_rows(self) -> int:
+        return min(self._capacity, self._known_rows)
+
+    def append_line(self, line: str) -> None:
+        """
+        Add a line to the end of the log. Lines that are too wide for the element are wrapped.
+        """
+        if self._max_lines <= 0:
+            return
+        if len(self._lines) >= self._max_lines:
+            self._remove_oldest_line()
+
+        self._lines.append(line)
+        if self._rings:
+            rows = self._write_line(line)
+            self._line_rows.append(rows)
+            self._known_rows += rows
+            self.mark_dirty()
+        else:
+            # The rows are rendered when the element receives its first update
+            self._line_rows.append(None)
+
+    def extend(self, lines: Iterable[str]) -> None:
+        """
+        Add each of the lines to the end of the log.
+        """
+        # Lines that would be removed by the lines after them are skipped
+        for line in deque(lines, maxlen=max(0, self._max_lines)):
+            self.append_line(line)
+
+    def clear(self) -> None:
+        """
+        Remove every line from the log.
+        """
+        self._lines.clear()
+        self._line_rows.clear()
+        self._known_rows = 0
+        self._rebuild()
+
+    def _remove_oldest_line(self) -> None:
+        self._lines.popleft()
+        if (rows := self._line_rows.popleft()) is not None:
+            self._known_rows -= rows
+
+    def _rebuild(self) -> None:
+        """
+        Create the ring surfaces for the current size of the element, and render the most recent
+        lines into them.
+        """
+        width, height = self._int_rect.size
+        if width <= 0 or height <= 0 or self.font is None:
+            self._rings = []
+            self._static_ring = None
+            return
+
+        pitch = self._pitch
+        self._capacity = max(1, (height + self.font.line_spacing) // pitch)
+        self._ring_width = width
+        self._head = 0
+        self._layers = self.font.get_layers(self.variant)
+        self._rings = [
+            pygame.Surface((width, self._capacity * pitch), pygame.SRCALPHA)
+            for _ in self._layers
+        ]
+        self._static_ring = (
+            pygame.Surface((width, self._capacity * pitch), pygame.SRCALPHA)
+            if self._get_is_static(self._layers)
+            else None
+        )
+
+        # Find the most recent lines that fill the ring, then render them from oldest to newest
+        self._line_rows = deque([None] * len(self._lines))
+        self._known_rows = 0
+        rendered = []
+        for n in range(len(self._lines) - 1, -1, -1):
+            if self._known_rows >= self._capacity:
+                break
+            surfaces, lines = self.font.render(
+                self._lines[n], self.variant, width, LEFT
+            )
+            rendered.append((n, surfaces))
+            self._line_rows[n] = len(lines)
+            self._known_rows += len(lines)
+
+        for n, surfaces in reversed(rendered):
+            self._write_surfaces(surfaces)
+
+        log.mls.info(
+            f"Rendered {len(rendered)} lines into a ring of {self._capacity} rows.", self
+        )
+        self.mark_dirty()
+
+    def _write_line(self, line: str) -> int:
+        """
+        Render a line and write its rows into the rings. Returns the number of rows.
+        """
+        surfaces, lines = self.font.render(line, self.variant, self._ring_width, LEFT)
+        self._write_surfaces(surfaces)
+        return len(lines)
+
+    def _write_surfaces(self, surfaces: Sequence[pygame.Surface]) -> None:
+        pitch = self._pitch
+        line_height = self.font.line_height
+        rows = (surfaces[0].get_height() + self.font.line_spacing) // pitch
+        first_row = max(0, rows - self._capacity)
+
+        rings = list(self._rings)
+        chunks = list(surfaces)
+        if self._static_ring is not None:
+            rings.append(self._static_ring)
+            chunks.append(self._apply_static_materials(surfaces))
+
+        for row in range(first_row, rows):
+            area = pygame.Rect(0, row * pitch, self._ring_width, line_height)
+            slot = pygame.Rect(0, self._head * pitch, self._ring_width, pitch)
+            for ring, chunk in zip(rings, chunks):
+                ring.fill((0, 0, 0, 0), slot)
+                # The slot is transparent, so this copies the row exactly
+                ring.blit(chunk, slot, area, special_flags=pygame.BLEND_RGBA_MAX)
+            self._head = (self._head + 1) % self._capacity
+
+    def _apply_static_materials(
+        self, surfaces: Sequence[pygame.Surface]
+    ) -> pygame.Surface:
+        """
+        Returns the surfaces combined into one surface, with the materials applied, in the same
+        way as the static surface of a MultiLayerSurfacable.
+        """
+        combined = None
+        for layer, surf in zip(self._layers, surfaces):
+            surf = surf.copy()
+            self._apply_material_to_surface(surf, layer, surf, (0, 0), update_mode=True)
+            if combined is None:
+                combined = surf
+            else:
+                combined.blit(surf, (0, 0))
+        return combined
+
+    def _material_trait_update_callback(self) -> None:
+        if not self._rings:
+            return
+        log.mls.line_break()
+        with log.mls.indent("Material changed, applying to rows...", self):
+            if self._get_is_static(self._layers):
+                self._static_ring = self._apply_static_materials(self._rings)
+            else:
+                self._static_ring = None
+        self.mark_dirty()
+
+    def _update_rect(
+        self, surface: pygame.Surface, x: float, y: float, w: float, h: float
+    ) -> None:
+        if not self._rings or (self._ring_width, self._capacity) != (
+            self._int_rect.w,
+            max(1, (self._int_rect.h + self.font.line_spacing) // self._pitch),
+        ):
+            with log.mls.indent("TextLog was resized, rendering rows...", self):
+                self._rebuild()
+
+    def _update_min_size(self) -> None:
+        self._min_size.w = 20
+        self._min_size.h = self.font.line_height
+
+    def _get_row_areas(self) -> list[tuple[pygame.Rect, int]]:
+        """
+        Returns the areas of the ring that contain the visible rows, and the y position to draw
+        each area at, from top to bottom.
+        """
+        pitch = self._pitch
+        visible = self._visible_rows
+        start = (self._head - visible) % self._capacity
+        first = min(visible, self._capacity - start)
+        areas = [(pygame.Rect(0, start * pitch, self._ring_width, first * pitch), 0)]
+        if first < visible:
+            areas.append(
+                (
+                    pygame.Rect(0, 0, self._ring_width, (visible - first) * pitch),
+                    first * pitch,
+                )
+            )
+        return areas
+
+    def _render(
+        self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
+    ) -> None:
+        if not self._rings or not self._visible_rows:
+            return
+        rect = self._int_rect.move(*offset)
+        x = rect.x - surface.get_abs_offset()[0]
+        y = rect.y - surface.get_abs_offset()[1]
+
+        if self._static_ring is not None:
+            self._static_ring.set_alpha(alpha)
+            for area, area_y in self._get_row_areas():
+                surface.blit(self._static_ring, (x, y + area_y), area)
+            return
+
+        # The materials are reapplied every tick, so the element is always dirty
+        self.mark_dirty()
+        self._draw_surface(surface, offset, self._get_surface(alpha, surface, (x, y)))
+
+    def _can_render_to_cache(self) -> bool:
+        return self._static_ring is not None or not self._rings
+
+    def _get_surface(
+        self,
+        alpha: int = 255,
+        destination: Optional[pygame.Surface] = None,
+        pos: tuple[int, int] = (0, 0),
+    ) -> pygame.Surface:
+        """
+        Returns the visible rows in order, with the materials applied.
+        """
+        height = max(1, self._visible_rows * self._pitch - self.font.line_spacing)
+        result = None
+        rings = [self._static_ring] if self._static_ring is not None else self._rings
+        for layer, ring in zip(self._layers, rings):
+            surf = pygame.Surface((max(1, self._ring_width), height), pygame.SRCALPHA)
+            for area, area_y in self._get_row_areas():
+                surf.blit(ring, (0, area_y), area, special_flags=pygame.BLEND_RGBA_MAX)
+            if self._static_ring is None:
+                self._apply_material_to_surface(
+                    surf, layer, surf if destination is None else destination, pos
+                )
+                self._apply_material_to_surface(
+                    surf, layer, surf, (0, 0), update_mode=True
+                )
+            if result is None:
+                result = surf
+            else:
+                result.blit(surf, (0, 0))
+        result.set_alpha(alpha)
+        return result
+
+    def _draw_surface(
+        self,
+        surface: pygame.Surface,
+        offset: tuple[int, int],
+        my_surface: pygame.Surface,
+    ) -> None:
+        rect = self._int_rect.move(*offset)
+        surface.blit(
+            my_surface,
+            (rect.x - surface.get_abs_offset()[0], rect.y - surface.get_abs_offset()[1]),
+        )
+
+
+TextLog.w.default_value = FILL
+TextLog.h.default_value = FILL
@@ -35,6 +35,9 @@ DPAD_NAMES = {
     14: _c.FocusDirection.RIGHT,
 }
 
+# If more dirty rects than this are collected in one tick, they are merged into a single rect.
+MAX_DIRTY_RECTS = 64
+
 class ViewMeta(ABCMeta):
     _context_stack: list["View"] = []
 
@@ -112,6 +115,8 @@ class View(ContextManager, metaclass=ViewMeta):
 
         self._joystick_cooldown = 0
         self._prev_rect: tuple[float, float, float, float] = (0, 0, 0, 0)
+        self._prev_alpha: int = 255
+        self._dirty_rects: list[pygame.Rect] = []
         self._joy_axis_motion: Sequence[int] = [0, 0]
 
         super().__init__()
@@ -136,9 +141,14 @@ class View(ContextManager, metaclass=ViewMeta):
         render: bool = True,
         alpha: int = 255,
         display_zoom: Union[DefaultType, int] = DEFAULT,
-    ) -> None:
+    ) -> list[pygame.Rect]:
         """
         Update the View. This should be called every tick.
+
+        Returns a list of the areas that were changed by this update, which can be passed to
+        :code:`pygame.display.update`. The rects are relative to the topmost parent of :code:`surface`.
+        If :code:`render` is :code:`False`, an empty list is returned and the changed areas are
+        reported by the next call that renders.
         """
         _c.delta_time = 1 / max(1.0, _c.clock.get_fps())
 
@@ -172,8 +182,10 @@ class View(ContextManager, metaclass=ViewMeta):
                     log.size.info(
                         self, "ViewLayer rect changed size, queueing for update."
                     )
+                    layer.mark_dirty()
                     layer.rect.update(*rect[:])
                     layer._int_rect.update(*rect[:])
+                    layer.mark_dirty()
                     layer.update_rect_next_tick()
 
                 if layer.rect_update_queue or layer.min_size_update_queue:
@@ -184,9 +196,8 @@ class View(ContextManager, metaclass=ViewMeta):
                     i = 0
                     start_time = time.time()
                     if layer.can_focus_update_queue:
-                        layer.can_focus_update_queue.sort(key=lambda x: len(x.ancestry), reverse=True)
                         while layer.can_focus_update_queue:
-                            element = layer.can_focus_update_queue.pop(0)
+                            element = layer.can_focus_update_queue.pop()
                             log.nav.line_break()
                             with log.nav.indent(f"Starting can_focus update for {element}..."):
                                 element.update_can_focus()
@@ -217,10 +228,19 @@ class View(ContextManager, metaclass=ViewMeta):
                     )
 
             if render:
+                if alpha != self._prev_alpha:
+                    layer.mark_dirty()
                 layer.render(surface, (0, 0), alpha)
+                self._dirty_rects += layer.dirty_rects
+                layer.dirty_rects.clear()
 
         self._prev_rect = tuple(rect)
 
+        dirty_rects = []
+        if render:
+            self._prev_alpha = alpha
+            dirty_rects = self._get_dirty_rects(surface)
+
         if update_elements:
             for layer in reversed(self._layers):
                 layer.update()
@@ -251,6 +271,26 @@ class View(ContextManager, metaclass=ViewMeta):
                     self._joystick_cooldown = 1
                     self.shift_focus(direction)
 
+        return dirty_rects
+
+    def _get_dirty_rects(self, surface: pygame.Surface) -> list[pygame.Rect]:
+        """
+        Clip and return the dirty rects collected since the last render, then clear them.
+        """
+        bounds = surface.get_abs_parent().get_rect()
+        dirty_rects = []
+        seen = set()
+        for rect in self._dirty_rects:
+            rect = rect.clip(bounds)
+            if rect and (key := tuple(rect)) not in seen:
+                seen.add(key)
+                dirty_rects.append(rect)
+        self._dirty_rects.clear()
+
+        if len(dirty_rects) > MAX_DIRTY_RECTS:
+            return [dirty_rects[0].unionall(dirty_rects)]
+        return dirty_rects
+
     def event(self, event: pygame.event.Event) -> bool:
         """
         Passes Pygame Events to the View. This should be called for each event in the event stack.
@@ -258,6 +298,7 @@ class View(ContextManager, metaclass=ViewMeta):
         if event.type == ember_event.VIEWEXITFINISHED:
             if event.layer in self._layers and len(self._layers) > 1:
                 self._layers.remove(event.layer)
+                self._dirty_rects.append(pygame.Rect(event.layer._int_rect))
                 log.nav.info(f"Removed layer {event.layer}.", self)
 
         for n, layer in enumerate(reversed(self._layers)):
@@ -3,15 +3,19 @@ from .. import event as ember_event
 from .. import common as _c
 from ..common import DEFAULT, DefaultType
 from .. import log
+from ..utility.depth_queue import DepthQueue
+from ..utility.spatial_grid import SpatialGrid
 from typing import Optional, TYPE_CHECKING, Any, Sequence, Union, TypeVar
 
 if TYPE_CHECKING:
     from .view import View
+    from .can_hover import CanHover
 
 from ember.ui.element import Element
 from ember.ui.single_element_container import SingleElementContainer
 from ember.ui.can_focus import CanHandleFocus, CanFocus
 from .geometric_container import GeometricContainer
+from .masked_container import MaskedContainer
 
 from ember.ui.old_scroll import Scroll
 
@@ -40,7 +44,7 @@ class ViewLayer(CanHandleFocus, SingleElementContainer, GeometricContainer):
         w: Optional[SizeType] = None,
         h: Optional[SizeType] = None
     ):
-        pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        _c.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
 
         self.view: "View" = view
         """
@@ -62,6 +66,13 @@ class ViewLayer(CanHandleFocus, SingleElementContainer, GeometricContainer):
         The element that is currently focused.
         """
 
+        self.hover_index: SpatialGrid["CanHover"] = SpatialGrid()
+        """
+        Stores the rect of each hoverable element in the layer. Read-only.
+        """
+
+        self._hovered_elements: list["CanHover"] = []
+
         super().__init__(
             element=element,
             rect=rect,
@@ -81,9 +92,14 @@ class ViewLayer(CanHandleFocus, SingleElementContainer, GeometricContainer):
         You can trigger the exit transition yourself by calling ViewLayer.exit() if you prefer.
         """
 
-        self.can_focus_update_queue: list[Element] = []
-        self.min_size_update_queue: list[tuple[Element, bool]] = []
-        self.rect_update_queue: list[Element] = []
+        self.can_focus_update_queue: DepthQueue = DepthQueue(deepest_first=True)
+        self.min_size_update_queue: DepthQueue = DepthQueue(deepest_first=True)
+        self.rect_update_queue: DepthQueue = DepthQueue()
+
+        self.dirty_rects: list[pygame.Rect] = []
+        """
+        The areas that have changed since the ViewLayer was last rendered. Read-only.
+        """
 
         self._exit_cause: Optional[Element] = None
         self._exit_kwargs: dict[Any:Any] = {}
@@ -98,15 +114,14 @@ class ViewLayer(CanHandleFocus, SingleElementContainer, GeometricContainer):
 
     def _process_queues(self, surface: pygame.Surface) -> None:
         while self.min_size_update_queue:
-            element, must_update_parent = self.min_size_update_queue.pop(0)
+            element, must_update_parent = self.min_size_update_queue.pop_with_flag()
             log.size.line_break()
             with log.size.indent(f"Starting min size update from element {element}."):
                 element.update_min_size(must_update_parent=must_update_parent)
 
         i = 0
         while self.rect_update_queue:
-            self.rect_update_queue.sort(key=lambda a: len(a.ancestry))
-            element = self.rect_update_queue.pop(0)
+            element = self.rect_update_queue.pop()
             log.size.line_break()
 
             if i > 0:
@@ -132,6 +147,49 @@ class ViewLayer(CanHandleFocus, SingleElementContainer, GeometricContainer):
                     "The maximimum number of update_rect calls from a ViewLayer on a single tick (300) was exceeded."
                 )
 
+    def _update(self) -> None:
+        self._update_hovered_elements()
+        super()._update()
+
+    def _update_hovered_elements(self) -> None:
+        """
+        Set the hovered state of the elements that the mouse has moved onto or away from.
+        """
+        hovered = [
+            element
+            for element in self.hover_index.query_point(_c.mouse_pos)
+            if self._is_hit(element)
+        ]
+        for element in self._hovered_elements:
+            if element not in hovered:
+                element._set_hovered(False)
+        for element in hovered:
+            if element not in self._hovered_elements:
+                element._set_hovered(True)
+        self._hovered_elements = hovered
+
+    @staticmethod
+    def _is_hit(element: "CanHover") -> bool:
+        """
+        Returns True if the mouse is over a part of the element that is shown. The rects of
+        elements that are culled by an ancestor can be out of date, so only visible elements
+        are hit, and only inside the rects of the ancestors that mask their children.
+        """
+        if not element.visible:
+            return False
+        return all(
+            ancestor.rect.collidepoint(_c.mouse_pos)
+            for ancestor in element.ancestry
+            if isinstance(ancestor, MaskedContainer)
+        )
+
+    def _remove_hoverable_element(self, element: "CanHover") -> None:
+        self.hover_index.discard(element)
+        if element in self._hovered_elements:
+            self._hovered_elements.remove(element)
+
+    _event_types = frozenset({pygame.MOUSEBUTTONDOWN})
+
     def _event(self, event: pygame.event.Event) -> bool:
         if self._element is not None and self._element.event(event):
             return True
@@ -177,7 +235,7 @@ class ViewLayer(CanHandleFocus, SingleElementContainer, GeometricContainer):
         """
         Finish transitioning.
         """
-        pygame.mouse.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
+        _c.set_cursor(pygame.SYSTEM_CURSOR_ARROW)
         new_event = pygame.event.Event(
             ember_event.VIEWEXITFINISHED,
             view=self.view,
@@ -189,6 +247,7 @@ class ViewLayer(CanHandleFocus, SingleElementContainer, GeometricContainer):
         pygame.event.post(new_event)
         if self.view._layers[0] is not self:
             self.view._layers.remove(self)
+            self.view._dirty_rects.append(pygame.Rect(self._int_rect))
 
     def start_manual_update(self) -> None:
         """
@@ -234,8 +293,7 @@ class ViewLayer(CanHandleFocus, SingleElementContainer, GeometricContainer):
                     # element.scroll_to_element(self.element_focused)
 
     def update_rect_next_tick(self) -> None:
-        if self not in self.layer.rect_update_queue:
-            self.layer.rect_update_queue.append(self)
+        self.layer.rect_update_queue.append(self)
 
     @property
     def index(self) -> int:
@@ -0,0 +1,193 @@
+import math
+import pygame
+from typing import Optional, Union, Sequence, Callable, Iterable, TYPE_CHECKING
+
+from ember import log
+from ember.ui.element import Element
+from .has_geometry import HasGeometry
+from .geometric_container import GeometricContainer
+
+from ..size import SizeType, OptionalSequenceSizeType, FILL
+from ember.position import PositionType, SequencePositionType
+
+if TYPE_CHECKING:
+    pass
+
+
+class VirtualVStack(GeometricContainer):
+    """
+    A vertical stack of rows that all have the same height, designed for long lists inside of a
+    :py:class:`Scroll<ember.ui.Scroll>`. Only the rows that intersect the visible area are
+    instantiated. When a row is scrolled out of view, its element is reused for a row that
+    has been scrolled into view.
+
+    :code:`row_factory` is called with no arguments to create a new row element, and
+    :code:`row_binder` is called with a row element and the index of the row it should display.
+    """
+
+    def __init__(
+        self,
+        row_count: int,
+        row_factory: Callable[[], HasGeometry],
+        row_binder: Callable[[HasGeometry, int], None],
+        row_height: float,
+        spacing: float = 0,
+        rect: Union[pygame.rect.RectType, Sequence, None] = None,
+        pos: Optional[SequencePositionType] = None,
+        x: Optional[PositionType] = None,
+        y: Optional[PositionType] = None,
+        size: OptionalSequenceSizeType = None,
+        w: Optional[SizeType] = None,
+        h: Optional[SizeType] = None,
+    ):
+        self._row_count: int = row_count
+        self._row_height: float = row_height
+        self._spacing: float = spacing
+
+        self.row_factory: Callable[[], HasGeometry] = row_factory
+        """
+        Called with no arguments to create a new row element.
+        """
+
+        self.row_binder: Callable[[HasGeometry, int], None] = row_binder
+        """
+        Called with a row element and a row index, to make the element display that row.
+        """
+
+        self._rows: dict[int, HasGeometry] = {}
+        self._unused_rows: list[HasGeometry] = []
+
+        super().__init__(rect=rect, pos=pos, x=x, y=y, size=size, w=w, h=h)
+
+    def __repr__(self) -> str:
+        return f"<VirtualVStack({self._row_count} rows, {len(self._rows)} instantiated)>"
+
+    @property
+    def row_count(self) -> int:
+        """
+        The number of rows in the stack.
+        """
+        return self._row_count
+
+    @row_count.setter
+    def row_count(self, value: int) -> None:
+        if value == self._row_count:
+            return
+        self._row_count = value
+        for index in [i for i in self._rows if i >= value]:
+            self._release_row(index)
+        self.update_min_size_next_tick()
+        self.update_rect_next_tick()
+
+    @property
+    def row_height(self) -> float:
+        """
+        The height of each row.
+        """
+        return self._row_height
+
+    @row_height.setter
+    def row_height(self, value: float) -> None:
+        self._row_height = value
+        self.update_min_size_next_tick()
+        self.update_rect_next_tick()
+
+    @property
+    def spacing(self) -> float:
+        """
+        The space between each row.
+        """
+        return self._spacing
+
+    @spacing.setter
+    def spacing(self, value: float) -> None:
+        self._spacing = value
+        self.update_min_size_next_tick()
+        self.update_rect_next_tick()
+
+    @property
+    def visible_rows(self) -> range:
+        """
+        The indices of the rows that are currently instantiated. Read-only.
+        """
+        if not self._rows:
+            return range(0)
+        return range(min(self._rows), max(self._rows) + 1)
+
+    def refresh(self) -> None:
+        """
+        Call :code:`row_binder` again for each instantiated row. Call this when the data that
+        the rows display changes.
+        """
+        for index, row in self._rows.items():
+            self.row_binder(row, index)
+            row.update_min_size(proprogate=False)
+
+    @property
+    def _child_elements(self) -> Iterable[Element]:
+        return self._rows.values()
+
+    def remove_child(self, element: Element) -> None:
+        raise ValueError(
+            f"Tried to remove child element {element} from container {self}. Change the "
+            f"row_count instead."
+        )
+
+    def _acquire_row(self, index: int) -> None:
+        if self._unused_rows:
+            element = self._unused_rows.pop()
+        else:
+            element = self.row_factory()
+            log.size.info(f"Created row element {element}.", self)
+        with self.adding_element(element, update=False) as element:
+            self._rows[index] = element
+        self.row_binder(element, index)
+        # The row might have been built while displaying a different index
+        element.update_min_size(proprogate=False)
+
+    def _release_row(self, index: int) -> None:
+        element = self._rows.pop(index)
+        self.removing_element(element, update=False)
+        self._unused_rows.append(element)
+
+    def _update_rect(
+        self, surface: pygame.Surface, x: float, y: float, w: float, h: float
+    ) -> None:
+        pitch = self._row_height + self._spacing
+
+        # Only the rows that intersect the visible area of the surface are instantiated
+        top = max(y, surface.get_abs_offset()[1])
+        bottom = min(y + h, surface.get_abs_offset()[1] + surface.get_height())
+        if bottom <= top or self._row_count == 0 or pitch <= 0:
+            first, last = 0, -1
+        else:
+            first = max(0, math.floor((top - y) / pitch))
+            last = min(self._row_count - 1, math.floor((bottom - y) / pitch))
+
+        for index in [i for i in self._rows if not first <= i <= last]:
+            self._release_row(index)
+
+        for index in range(first, last + 1):
+            if index not in self._rows:
+                self._acquire_row(index)
+
+            element = self._rows[index]
+            element_w = element.get_w(w)
+            if element.visible != self.visible:
+                element._set_visible(self.visible)
+            element.update_rect(
+                surface,
+                x + element.get_x(w, element_w),
+                y + index * pitch,
+                element_w,
+                self._row_height,
+            )
+
+    def _update_min_size(self) -> None:
+        self._min_size.w = 20
+        self._min_size.h = max(
+            0, self._row_count * (self._row_height + self._spacing) - self._spacing
+        )
+
+
+VirtualVStack.w.default_value = FILL
@@ -0,0 +1,106 @@
+import heapq
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from ember.ui.element import Element
+
+
+class DepthQueue:
+    """
+    A queue of Elements, ordered by how deep each Element is in the element tree. Elements at the
+    same depth are popped in the order that they were added. Each Element can only be in the queue once.
+    Used by ViewLayer to store the Elements waiting for an update on the next tick.
+    """
+
+    def __init__(self, deepest_first: bool = False) -> None:
+        self.deepest_first: bool = deepest_first
+        """
+        If True, the deepest Elements are popped first. Otherwise, the shallowest Elements are popped first.
+        """
+
+        # Maps each depth to an insertion-ordered dict of the Elements at that depth, and their flags.
+        self._buckets: dict[int, dict["Element", bool]] = {}
+        self._depths: dict["Element", int] = {}
+        # Heap of the keys of self._buckets. May contain keys of buckets that no longer exist.
+        self._heap: list[int] = []
+
+    def __repr__(self) -> str:
+        return f"<DepthQueue({len(self._depths)} elements)>"
+
+    def __len__(self) -> int:
+        return len(self._depths)
+
+    def __bool__(self) -> bool:
+        return bool(self._depths)
+
+    def __contains__(self, element: "Element") -> bool:
+        return element in self._depths
+
+    def __iter__(self) -> Iterator["Element"]:
+        return iter(tuple(self._depths))
+
+    def _get_key(self, element: "Element") -> int:
+        depth = len(element.ancestry)
+        return -depth if self.deepest_first else depth
+
+    def append(self, element: "Element", flag: bool = False) -> None:
+        """
+        Add an Element to the queue. If the Element is already queued, its flag is set to True if
+        either the existing flag or the new flag is True.
+        """
+        if (key := self._depths.get(element)) is not None:
+            bucket = self._buckets[key]
+            bucket[element] = bucket[element] or flag
+            return
+
+        key = self._get_key(element)
+        if (bucket := self._buckets.get(key)) is None:
+            bucket = self._buckets[key] = {}
+            heapq.heappush(self._heap, key)
+        bucket[element] = flag
+        self._depths[element] = key
+
+    def discard(self, element: "Element") -> None:
+        """
+        Remove an Element from the queue, if it is present.
+        """
+        if (key := self._depths.pop(element, None)) is not None:
+            del self._buckets[key][element]
+
+    def pop(self) -> "Element":
+        """
+        Remove and return the next Element.
+        """
+        return self.pop_with_flag()[0]
+
+    def pop_with_flag(self) -> tuple["Element", bool]:
+        """
+        Remove and return the next Element, along with its flag.
+        """
+        while self._heap:
+            key = self._heap[0]
+            bucket = self._buckets.get(key)
+            if not bucket:
+                heapq.heappop(self._heap)
+                self._buckets.pop(key, None)
+                continue
+
+            element = next(iter(bucket))
+            flag = bucket.pop(element)
+            del self._depths[element]
+
+            # The element was moved in the tree after it was queued
+            if self._get_key(element) != key:
+                self.append(element, flag)
+                continue
+
+            return element, flag
+        raise IndexError("pop from an empty DepthQueue")
+
+    def clear(self) -> None:
+        """
+        Remove all Elements from the queue.
+        """
+        self._buckets.clear()
+        self._depths.clear()
+        self._heap.clear()
@@ -0,0 +1,88 @@
+import math
+import pygame
+from typing import Generic, TypeVar, Iterator
+
+T = TypeVar("T")
+
+
+class SpatialGrid(Generic[T]):
+    """
+    A uniform grid that stores objects by the area of their rect, for finding the objects
+    at a point without checking every object. Used by ViewLayer to find hovered elements.
+    """
+
+    def __init__(self, cell_size: int = 64) -> None:
+        self.cell_size: int = cell_size
+        """
+        The width and height of each cell of the grid.
+        """
+
+        self._cells: dict[tuple[int, int], dict[T, pygame.FRect]] = {}
+        self._items: dict[T, tuple[pygame.FRect, tuple[tuple[int, int], ...]]] = {}
+
+    def __repr__(self) -> str:
+        return f"<SpatialGrid({len(self._items)} items)>"
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item: T) -> bool:
+        return item in self._items
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(tuple(self._items))
+
+    def _get_cells(self, rect: pygame.FRect) -> tuple[tuple[int, int], ...]:
+        if rect.w <= 0 or rect.h <= 0:
+            return ()
+        size = self.cell_size
+        return tuple(
+            (x, y)
+            for x in range(math.floor(rect.left / size), math.floor(rect.right / size) + 1)
+            for y in range(math.floor(rect.top / size), math.floor(rect.bottom / size) + 1)
+        )
+
+    def update(self, item: T, rect: pygame.FRect) -> None:
+        """
+        Add an object to the grid, or move it if it is already in the grid.
+        """
+        rect = pygame.FRect(rect)
+        if (entry := self._items.get(item)) is not None:
+            if entry[0] == rect:
+                return
+            self.discard(item)
+
+        cells = self._get_cells(rect)
+        for cell in cells:
+            if (contents := self._cells.get(cell)) is None:
+                contents = self._cells[cell] = {}
+            contents[item] = rect
+        self._items[item] = (rect, cells)
+
+    def discard(self, item: T) -> None:
+        """
+        Remove an object from the grid, if it is present.
+        """
+        if (entry := self._items.pop(item, None)) is None:
+            return
+        for cell in entry[1]:
+            contents = self._cells[cell]
+            del contents[item]
+            if not contents:
+                del self._cells[cell]
+
+    def query_point(self, pos: tuple[float, float]) -> list[T]:
+        """
+        Returns the objects whose rects contain the point.
+        """
+        cell = (math.floor(pos[0] / self.cell_size), math.floor(pos[1] / self.cell_size))
+        if (contents := self._cells.get(cell)) is None:
+            return []
+        return [item for item, rect in contents.items() if rect.collidepoint(pos)]
+
+    def clear(self) -> None:
+        """
+        Remove all objects from the grid.
+        """
+        self._cells.clear()
+        self._items.clear()
@@ -0,0 +1,33 @@
+import os
+import sys
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+
+pygame.init()
+screen = pygame.display.set_mode((800, 600))
+
+import ember
+from ember.material import Blur
+
+ember.init()
+
+
+class Element:
+    pass
+
+
+def test_small_change_behind_blur_is_detected():
+    background = pygame.Surface((800, 600))
+    blur = Blur(10, ember.BLUR_KAWASE, recalculate_each_tick=True)
+    element = Element()
+
+    first = blur.render(element, background, (0, 0), (640, 360), 255)
+    assert blur.render(element, background, (0, 0), (640, 360), 255) is first
+
+    # Smaller than the spacing between the pixels of the scaled down copy
+    background.fill((255, 255, 255), (306, 152, 5, 5))
+    assert blur.render(element, background, (0, 0), (640, 360), 255) is not first
@@ -0,0 +1,77 @@
+import os
+import sys
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+import pytest
+
+pygame.init()
+screen = pygame.display.set_mode((800, 600))
+
+from ember.style import pixel_dark as ui
+import ember
+
+ember.init()
+ember.set_clock(pygame.time.Clock())
+
+
+def render(retain_render: bool, *elements: ui.Element) -> tuple[bytes, bool]:
+    stack = ui.ZStack(*elements, w=120, h=120)
+    stack.retain_render = retain_render
+    view = ui.View(stack)
+    for _ in range(3):
+        screen.fill((0, 0, 255))
+        view.update(screen)
+    return pygame.image.tobytes(screen, "RGB"), stack._render_cache is not None
+
+
+@pytest.mark.parametrize("overlapping", [False, True])
+def test_retained_render_matches_direct_render(overlapping):
+    def elements():
+        offset = 40 if overlapping else 60
+        return (
+            ui.Panel((255, 0, 0, 128), w=60, h=60, x=0, y=0),
+            ui.Panel((0, 255, 0, 128), w=60, h=60, x=offset, y=offset),
+            ui.Text("hello"),
+        )
+
+    direct, _ = render(False, *elements())
+    retained, cached = render(True, *elements())
+    assert retained == direct
+    # Overlapping translucent elements can't be blended onto the background in one blit
+    assert cached != overlapping
+
+
+def test_exactness_is_only_checked_when_the_layout_changes(monkeypatch):
+    checks = []
+    check = ui.ZStack._is_render_cache_exact
+    monkeypatch.setattr(
+        ui.ZStack,
+        "_is_render_cache_exact",
+        lambda self, *args: checks.append(self) or check(self, *args),
+    )
+
+    panel = ui.Panel((255, 0, 0, 128), w=60, h=60, x=0, y=0)
+    other = ui.Panel((0, 255, 0, 128), w=60, h=60, x=60, y=60)
+    stack = ui.ZStack(panel, other, w=120, h=120)
+    stack.retain_render = True
+    view = ui.View(stack)
+    for _ in range(3):
+        view.update(screen)
+    assert len(checks) == 1 and stack._render_cache is not None
+
+    # Clearing the cache without moving anything doesn't check again
+    for _ in range(3):
+        panel.mark_dirty()
+        view.update(screen)
+    assert len(checks) == 1 and stack._render_cache is not None
+
+    # Moving the panel so that it overlaps the other one does
+    other.x = 30
+    other.y = 30
+    for _ in range(3):
+        view.update(screen)
+    assert len(checks) == 2 and stack._render_cache is None
@@ -0,0 +1,87 @@
+import os
+import sys
+
+os.environ["SDL_VIDEODRIVER"] = "dummy"
+os.environ["SDL_AUDIODRIVER"] = "dummy"
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+import pygame
+import pytest
+
+pygame.init()
+screen = pygame.display.set_mode((800, 600))
+
+from ember.style import pixel_dark as ui
+import ember
+
+ember.init()
+ember.set_clock(pygame.time.Clock())
+
+
+@pytest.fixture
+def mouse(monkeypatch):
+    pos = [(0, 0)]
+    monkeypatch.setattr(pygame.mouse, "get_pos", lambda: pos[0])
+    return pos
+
+
+def test_scrolled_out_rows_are_not_hovered(mouse):
+    buttons = [ui.Button(str(i), w=100, h=20) for i in range(200)]
+    rows = [ui.HStack(button, w=200, h=30) for button in buttons]
+    scroll = ui.Scroll(ui.VStack(*rows, w=200), w=300, h=400)
+    view = ui.View(scroll)
+    view.update(screen)
+
+    mouse[0] = (int(buttons[0].rect.centerx), int(buttons[0].rect.centery))
+    view.update(screen)
+    assert [i for i, button in enumerate(buttons) if button.hovered] == [0]
+
+    scroll.scroll_value = 3000
+    for _ in range(3):
+        view.update(screen)
+
+    # The rows that left the window keep their old rects, so their descendants must be hidden
+    for row, button in zip(rows, buttons):
+        assert button.visible == row.visible
+        if button.hovered:
+            assert button.rect.collidepoint(mouse[0])
+    assert not buttons[0].hovered
+    assert sum(button.visible for button in buttons) < len(buttons)
+
+    scroll.scroll_value = 0
+    for _ in range(3):
+        view.update(screen)
+    assert buttons[0].visible
+    assert [i for i, button in enumerate(buttons) if button.hovered] == [0]
+
+
+def test_masked_part_of_element_is_not_hovered(mouse):
+    buttons = [ui.Button(str(i), w=100, h=40) for i in range(20)]
+    scroll = ui.Scroll(ui.VStack(*buttons, w=200), w=300, h=100)
+    view = ui.View(scroll)
+    view.update(screen)
+
+    # A button that is cut off by the bottom edge of the Scroll
+    button = next(i for i in buttons if i.rect.top < scroll.rect.bottom < i.rect.bottom)
+    mouse[0] = (int(button.rect.centerx), int(scroll.rect.bottom) + 1)
+    view.update(screen)
+    assert not button.hovered
+
+    mouse[0] = (int(button.rect.centerx), int(scroll.rect.bottom) - 2)
+    view.update(screen)
+    assert button.hovered
+
+
+def test_culled_rects_are_moved_when_read():
+    items = [ui.Text(f"Row {i}") for i in range(300)]
+    scroll = ui.Scroll(ui.VStack(*items, spacing=4), w=300, h=500)
+    view = ui.View(scroll)
+    view.update(screen)
+    start = [item.rect.y for item in items]
+
+    scroll.scroll_value = 500
+    for _ in range(3):
+        view.update(screen)
+
+    assert not items[5].visible and not items[200].visible
+    assert [item.rect.y for item in items] == [y - 500 for y in start]